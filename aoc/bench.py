@@ -0,0 +1,487 @@
+import json
+import math
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from aoc.generators import generate
+from aoc.inputs import group_lines
+from aoc.memory import trace_memory
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent.parent / "bench_baseline.json"
+
+Runner = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    prepare: Callable[[int, int], Runner]  # (size, seed) -> solver call to time
+    sizes: Sequence[int]
+    # bytes per item, the traced peak of the biggest size can't go over it
+    max_peak_per_item: Optional[float] = None
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    sizes: List[int]
+    times: List[float]
+    peaks: List[int] = field(default_factory=list)  # bytes, with --bench-memory
+    blocks: List[int] = field(default_factory=list)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def exponent(self) -> float:
+        return fit_exponent(self.sizes, self.times)
+
+
+def fit_exponent(sizes: Sequence[int], times: Sequence[float]) -> float:
+    # Least squares slope of log(time) over log(size): time ~ size ** exponent
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if not variance:
+        return 0.0
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance
+
+
+def time_runner(runner: Runner, repeat: int = 3) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        runner()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(
+    benchmark: Benchmark, repeat: int = 3, seed: int = 0, memory: bool = False
+) -> BenchmarkResult:
+    result = BenchmarkResult(benchmark.name, list(benchmark.sizes), [])
+    for size in benchmark.sizes:
+        runner = benchmark.prepare(size, seed)
+        result.times.append(time_runner(runner, repeat))
+        if memory:
+            # Its own run, tracemalloc slows the solver down a lot
+            _, usage = trace_memory(runner, top=0)
+            result.peaks.append(usage.peak)
+            result.blocks.append(usage.blocks)
+    return result
+
+
+def regression(result: BenchmarkResult, baseline: BenchmarkResult) -> float:
+    # Relative slowdown of the whole ladder, in percentage
+    if result.sizes != baseline.sizes:
+        raise ValueError(
+            f"{result.name} sizes {result.sizes} don't match the baseline "
+            f"{baseline.sizes}, record it again with --bench-save"
+        )
+    return (sum(result.times) / sum(baseline.times) - 1) * 100
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> Dict[str, BenchmarkResult]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return {
+            name: BenchmarkResult(**result) for name, result in json.load(f).items()
+        }
+
+
+def save_baseline(
+    results: Dict[str, BenchmarkResult], path: Path = DEFAULT_BASELINE
+) -> None:
+    with open(path, "w") as f:
+        json.dump(
+            {name: asdict(result) for name, result in results.items()}, f, indent=2
+        )
+
+
+def format_result(result: BenchmarkResult) -> str:
+    points = "  ".join(
+        f"{size}: {seconds * 1000:.2f}ms"
+        for size, seconds in zip(result.sizes, result.times)
+    )
+    per_item = result.times[-1] / result.sizes[-1] * 1e6
+    peak = f"  peak {max(result.peaks) / 1024:.0f} KiB" if result.peaks else ""
+    return (
+        f"{result.name:<36} O(n^{result.exponent:.2f})  {points}  "
+        f"{per_item:.2f}us/n{peak}"
+    )
+
+
+def _lines(day: int, size: int, seed: int) -> List[str]:
+    return generate(day, size, seed).splitlines()
+
+
+def _expense_report(size: int, seed: int) -> Runner:
+    from test_day01.test_ex1 import expense_report
+
+    expenses = [int(line) for line in _lines(1, size, seed)]
+    return lambda: expense_report(expenses)
+
+
+def _expense_report_v2(size: int, seed: int) -> Runner:
+    from test_day01.test_ex2 import expense_report_v2
+
+    expenses = [int(line) for line in _lines(1, size, seed)]
+    return lambda: expense_report_v2(expenses)
+
+
+def _expense_index_query(size: int, seed: int) -> Runner:
+    import random
+
+    from test_day01.test_ex1 import ExpenseIndex
+
+    expenses = [int(line) for line in _lines(1, 200, seed)]
+    targets = [random.Random(seed).randrange(1000, 4000) for _ in range(size)]
+
+    def run() -> None:
+        index = ExpenseIndex(expenses)
+        index.query(targets, 2)
+        index.query(targets, 3)
+
+    return run
+
+
+def _expense_index(size: int, seed: int) -> Runner:
+    import random
+
+    from test_day01.test_ex1 import ExpenseIndex
+
+    # Wide values, the generated ones are all below 2020 (a thousand distinct)
+    rng = random.Random(seed)
+    expenses = [rng.randrange(1, 100 * size) for _ in range(size)]
+    targets = [rng.randrange(1, 100 * size) for _ in range(100)]
+    return lambda: ExpenseIndex(expenses).query(targets, 2)
+
+
+def _valid_password_counter(size: int, seed: int) -> Runner:
+    from test_day02.test_ex4 import PasswordPolicy, valid_password_counter
+
+    passwords = [PasswordPolicy.from_text_line(line) for line in _lines(2, size, seed)]
+    return lambda: valid_password_counter(passwords)
+
+
+def _password_policy_from_text(size: int, seed: int) -> Runner:
+    from test_day02.test_ex3 import PasswordPolicy
+
+    text = generate(2, size, seed)
+    return lambda: PasswordPolicy.from_text(text)
+
+
+def _columnar_valid_password_counter(size: int, seed: int) -> Runner:
+    from test_day02.test_ex4 import PasswordColumns, columnar_valid_password_counter
+
+    text = generate(2, size, seed).encode()
+    # Parsing included, it is most of the work of the columnar path
+    return lambda: columnar_valid_password_counter(PasswordColumns.from_bytes(text))
+
+
+def _slope_tree_count(size: int, seed: int) -> Runner:
+    from test_day03.test_ex6 import TreeRow, slope_tree_count
+
+    treemap = [TreeRow(line) for line in _lines(3, size, seed)]
+    return lambda: slope_tree_count(treemap, 3, 1)
+
+
+def _multi_slope_tree_count(size: int, seed: int) -> Runner:
+    from test_day03.test_ex6 import TreeRow, multi_slope_tree_count
+
+    treemap = [TreeRow(line) for line in _lines(3, size, seed)]
+    slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+    return lambda: multi_slope_tree_count(treemap, slopes)
+
+
+def _count_valid_passports(size: int, seed: int) -> Runner:
+    from test_day04.test_ex8 import build_passport_from_lines, count_valid_passports
+
+    passports = [
+        build_passport_from_lines(lines) for lines in group_lines(_lines(4, size, seed))
+    ]
+    return lambda: count_valid_passports(passports)
+
+
+def _count_valid_records(size: int, seed: int) -> Runner:
+    from test_day04.test_ex8 import count_valid_records
+
+    # Generating a million passports takes minutes, repeat a smaller batch
+    batch = generate(4, min(size, 10000), seed).encode()
+    records = batch.split(b"\n\n") * (size // 10000 or 1)
+    return lambda: count_valid_records(records)
+
+
+def _get_seat_id(size: int, seed: int) -> Runner:
+    from test_day05.test_ex10 import get_seat_id
+
+    boarding_passes = _lines(5, size, seed)
+    return lambda: [get_seat_id(boarding_pass) for boarding_pass in boarding_passes]
+
+
+def _find_missing_seat(size: int, seed: int) -> Runner:
+    from test_day05.test_ex10 import decode_seat_ids, find_missing_seat
+
+    boarding_passes = generate(5, size, seed).encode()
+    return lambda: find_missing_seat(decode_seat_ids(boarding_passes))
+
+
+def _count_all_affirmative_answers(size: int, seed: int) -> Runner:
+    from test_day06.test_ex12 import count_all_affirmative_answers_from_group
+
+    groups = list(group_lines(_lines(6, size, seed)))
+    return lambda: sum(count_all_affirmative_answers_from_group(g) for g in groups)
+
+
+def _count_answers(size: int, seed: int) -> Runner:
+    from test_day06.test_ex11 import count_answers, group_answers
+
+    data = generate(6, size, seed).encode()
+    return lambda: count_answers(group_answers(data))
+
+
+def _count_bags_containing_bag(size: int, seed: int) -> Runner:
+    from test_day07.test_ex13 import (
+        count_bags_containing_bag,
+        line_to_rule,
+        rules_to_graph,
+    )
+
+    graph = rules_to_graph([line_to_rule(line) for line in _lines(7, size, seed)])
+    return lambda: count_bags_containing_bag(graph, "shiny gold")
+
+
+def _parse_rules(size: int, seed: int) -> Runner:
+    from test_day07.test_ex13 import BagGraph, parse_rules
+
+    data = generate(7, size, seed).encode()
+    return lambda: BagGraph.from_edges(parse_rules(data))
+
+
+def _line_to_rule(size: int, seed: int) -> Runner:
+    from test_day07.test_ex13 import line_to_rule, rules_to_graph
+
+    lines = _lines(7, size, seed)
+    return lambda: rules_to_graph([line_to_rule(line) for line in lines])
+
+
+def _bag_graph_and_queries(size: int, seed: int) -> Tuple[Any, List[str]]:
+    import random
+
+    from test_day07.test_ex13 import line_to_rule, rules_to_graph
+
+    # Thousands of queries, the same bag can be asked for again
+    graph = rules_to_graph([line_to_rule(line) for line in _lines(7, size, seed)])
+    return graph, random.Random(seed).choices(graph.names, k=5000)
+
+
+def _ancestor_index(size: int, seed: int) -> Runner:
+    from test_day07.test_ex13 import AncestorIndex
+
+    graph, queries = _bag_graph_and_queries(size, seed)
+
+    def run() -> None:
+        index = AncestorIndex(graph)
+        [index.count(bag_name) for bag_name in queries]
+
+    return run
+
+
+def _count_ancestors(size: int, seed: int) -> Runner:
+    from test_day07.test_ex13 import count_ancestors
+
+    graph, queries = _bag_graph_and_queries(size, seed)
+
+    def run() -> None:
+        parents = graph.parents()
+        [count_ancestors(parents, graph.ids[bag_name]) for bag_name in queries]
+
+    return run
+
+
+def _count_total_contained_bags(size: int, seed: int) -> Runner:
+    from test_day07.test_ex13 import line_to_rule, rules_to_graph
+    from test_day07.test_ex14 import count_total_contained_bags
+
+    graph = rules_to_graph([line_to_rule(line) for line in _lines(7, size, seed)])
+    return lambda: count_total_contained_bags(graph, "shiny gold")
+
+
+def _rule_set_edits(size: int, seed: int) -> Runner:
+    import random
+
+    from test_day07.test_ex13 import Rule, line_to_rule
+    from test_day07.test_ex14 import RuleSet
+
+    rules = [line_to_rule(line) for line in _lines(7, size, seed)]
+    rule_set = RuleSet(rules)
+    rng = random.Random(seed)
+    # 100 edits: new quantities, or a bag dropped from the contents, which
+    # changes the ancestors of that bag too. The answers are asked again after
+    # every edit, and again once the original rule is back.
+    edits = []
+    for rule in rng.sample(rules, 100):
+        contents = {bag: rng.randint(1, 5) for bag in rule.contents}
+        if contents and rng.random() < 0.5:
+            del contents[rng.choice(list(contents))]
+        edits.append((rule, Rule(rule.bag, contents)))
+
+    def run() -> None:
+        for rule, edit in edits:
+            for new_rule in (edit, rule):
+                rule_set.set_rule(new_rule)
+                rule_set.total(rule.bag)
+                rule_set.total("shiny gold")
+                for child in rule.contents:
+                    rule_set.ancestors(child)
+
+    return run
+
+
+def _sanitize_instructions(size: int, seed: int) -> Runner:
+    from test_day08.test_ex16 import line_to_instruction, sanitize_instructions
+
+    instructions = [line_to_instruction(line) for line in _lines(8, size, seed)]
+    return lambda: sanitize_instructions(instructions)
+
+
+def _execute_program(size: int, seed: int, blocks: bool = False) -> Runner:
+    from test_day08.test_ex16 import InfiniteLoopError, Program, line_to_instruction
+
+    program = Program([line_to_instruction(line) for line in _lines(8, size, seed)])
+
+    def run() -> None:
+        try:
+            program.execute(blocks)
+        except InfiniteLoopError:
+            pass  # generated programs loop until fixed
+
+    run()  # the blocks are compiled on the first run
+    return run
+
+
+def _execute_program_blocks(size: int, seed: int) -> Runner:
+    return _execute_program(size, seed, blocks=True)
+
+
+def _find_invalid_number(size: int, seed: int) -> Runner:
+    from test_day09.test_ex17 import find_invalid_number
+
+    numbers = [int(line) for line in _lines(9, size, seed)]
+    return lambda: find_invalid_number(numbers)
+
+
+def _count_all_possible_paths(size: int, seed: int) -> Runner:
+    from test_day10.test_ex20 import count_all_possible_paths
+
+    adapters = [int(line) for line in _lines(10, size, seed)]
+    return lambda: count_all_possible_paths(adapters)
+
+
+def _iterate_until_no_changes(size: int, seed: int) -> Runner:
+    from test_day11.test_ex21 import SeatLayout
+
+    layout = SeatLayout(_lines(11, size, seed))
+    return lambda: layout.iterate_until_no_changes()
+
+
+def _process_actions(size: int, seed: int) -> Runner:
+    from test_day12.test_ex24 import line_to_action, process_actions
+
+    actions = [line_to_action(line) for line in _lines(12, size, seed)]
+    return lambda: process_actions(actions)
+
+
+def _find_earliest_timestamp(size: int, seed: int) -> Runner:
+    from test_day13.test_ex26 import find_eatliest_timestamp
+
+    shuttles = {
+        i: int(shuttle)
+        for i, shuttle in enumerate(_lines(13, size, seed)[1].split(","))
+        if shuttle != "x"
+    }
+    return lambda: find_eatliest_timestamp(shuttles)
+
+
+def _play_memory_game(size: int, seed: int) -> Runner:
+    from test_day15.test_ex30 import play_memory_game
+
+    starting_numbers = [int(n) for n in generate(15, seed=seed).split(",")]
+    return lambda: play_memory_game(starting_numbers, size)  # size is the turns
+
+
+def _next_cycle(size: int, seed: int) -> Runner:
+    from test_day17.test_ex34 import build_pocket_dimension_from_lines
+
+    dimension = build_pocket_dimension_from_lines(_lines(17, size, seed))
+    return lambda: dimension.next_cycle()
+
+
+def _solve_operation(size: int, seed: int) -> Runner:
+    from test_day18.test_ex36 import solve_operation
+
+    lines = _lines(18, size, seed)
+    return lambda: [solve_operation(line) for line in lines]
+
+
+BENCHMARKS = [
+    Benchmark("expense_report", _expense_report, (1000, 10000, 100000)),
+    Benchmark("expense_report_v2", _expense_report_v2, (1000, 10000, 100000)),
+    Benchmark("ExpenseIndex.query", _expense_index_query, (100, 1000, 10000)),
+    Benchmark("ExpenseIndex", _expense_index, (1000, 10000, 100000)),
+    Benchmark("valid_password_counter", _valid_password_counter, (1000, 4000, 16000)),
+    Benchmark(
+        "PasswordPolicy.from_text", _password_policy_from_text, (1000, 4000, 16000)
+    ),
+    Benchmark(
+        "columnar_valid_password_counter",
+        _columnar_valid_password_counter,
+        (16000, 256000, 1024000),
+    ),
+    Benchmark("slope_tree_count", _slope_tree_count, (323, 1292, 5168)),
+    Benchmark("multi_slope_tree_count", _multi_slope_tree_count, (5168, 20672, 82688)),
+    Benchmark("count_valid_passports", _count_valid_passports, (276, 1104, 4416)),
+    Benchmark("count_valid_records", _count_valid_records, (10000, 100000, 1000000)),
+    Benchmark("get_seat_id", _get_seat_id, (250, 1000, 4000)),
+    Benchmark("find_missing_seat", _find_missing_seat, (4000, 64000, 1024000)),
+    Benchmark(
+        "count_all_affirmative_answers",
+        _count_all_affirmative_answers,
+        (473, 1892, 7568),
+    ),
+    Benchmark("count_answers", _count_answers, (7568, 60544, 484352)),
+    Benchmark(
+        "count_bags_containing_bag", _count_bags_containing_bag, (594, 2376, 9504)
+    ),
+    Benchmark("parse_rules", _parse_rules, (9504, 38016, 152064)),
+    Benchmark("line_to_rule", _line_to_rule, (9504, 38016, 152064)),
+    # The same 1000 queries: the index built once against a traversal each
+    Benchmark(
+        "AncestorIndex",
+        _ancestor_index,
+        (3000, 10000, 30000),
+        max_peak_per_item=2048,  # a tuple of a few hundred ancestors per bag
+    ),
+    Benchmark("count_ancestors", _count_ancestors, (3000, 10000, 30000)),
+    Benchmark(
+        "count_total_contained_bags", _count_total_contained_bags, (594, 2376, 9504)
+    ),
+    Benchmark("RuleSet.set_rule", _rule_set_edits, (10000, 30000, 100000)),
+    Benchmark("sanitize_instructions", _sanitize_instructions, (150, 300, 600, 1200)),
+    Benchmark("Program.execute", _execute_program, (1200, 12000, 120000)),
+    Benchmark("Program.execute blocks", _execute_program_blocks, (1200, 12000, 120000)),
+    Benchmark("find_invalid_number", _find_invalid_number, (250, 500, 1000, 2000)),
+    Benchmark(
+        "count_all_possible_paths", _count_all_possible_paths, (103, 1030, 10300)
+    ),
+    Benchmark(
+        "SeatLayout.iterate_until_no_changes", _iterate_until_no_changes, (4, 8, 16)
+    ),
+    Benchmark("process_actions", _process_actions, (780, 3120, 12480)),
+    Benchmark("find_eatliest_timestamp", _find_earliest_timestamp, (102, 408, 1632)),
+    Benchmark("play_memory_game", _play_memory_game, (10000, 40000, 160000)),
+    Benchmark("PocketDimension.next_cycle", _next_cycle, (3, 6, 12)),
+    Benchmark("solve_operation", _solve_operation, (189, 378, 1512)),
+]
@@ -0,0 +1,149 @@
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIRECTORY = ROOT / ".aoc_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Opts the cached() of the __main__ blocks in, the runner always clears it
+ENABLE_VARIABLE = "AOC_CACHE"
+
+T = TypeVar("T")
+
+
+class ResultCache:
+    # One pickle file per key. Hits touch the file, so evicting the files with
+    # the oldest modification time first is LRU.
+    def __init__(
+        self, directory: Path = DEFAULT_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    @staticmethod
+    def key(source: bytes, input_data: bytes = b"", arguments: Any = ()) -> str:
+        digest = hashlib.sha256()
+        for part in (source, input_data, pickle.dumps(arguments)):
+            digest.update(hashlib.sha256(part).digest())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.pickle"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def __getitem__(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            raise KeyError(key)
+        os.utime(path)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # Write and rename, so parallel runs never read half a file
+        with tempfile.NamedTemporaryFile(dir=self._directory, delete=False) as f:
+            pickle.dump(value, f)
+        os.replace(f.name, self._path(key))
+        self._evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        try:
+            return self[key]
+        except KeyError:
+            value = compute()
+            self[key] = value
+            return value
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _entries(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        for path in self._directory.glob("*.pickle"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process meanwhile
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+
+def local_sources(path: Path, root: Optional[Path] = None) -> List[Path]:
+    # The file and every module of the repo it imports, directly or through
+    # another one (part two importing part one, aoc.inputs...). Imports are
+    # read from the source, the ones inside functions or __main__ included.
+    import ast
+
+    root = ROOT if root is None else root
+    found: Dict[Path, None] = {}
+    pending = [path.resolve()]
+    while pending:
+        current = pending.pop()
+        if current in found:
+            continue
+        found[current] = None
+        for node in ast.walk(ast.parse(current.read_bytes())):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+                names += [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                pending.extend(_module_files(name, root))
+    return sorted(found)
+
+
+def _module_files(name: str, root: Path) -> Iterator[Path]:
+    # The module and the __init__ of its packages, when they are in the repo
+    parts = name.split(".")
+    for i in range(1, len(parts) + 1):
+        package = root.joinpath(*parts[:i])
+        for path in (package / "__init__.py", package.with_suffix(".py")):
+            if path.is_file():
+                yield path.resolve()
+
+
+def sources_digest(path: Path, root: Optional[Path] = None) -> bytes:
+    digest = hashlib.sha256()
+    for source in local_sources(path, root):
+        digest.update(hashlib.sha256(source.read_bytes()).digest())
+    return digest.digest()
+
+
+def cached(
+    function: Callable[..., T], cache: Optional[ResultCache] = None
+) -> Callable[..., T]:
+    # The key covers the source file of the function, every repo module it
+    # imports and the arguments, so editing any of them or the input
+    # recomputes it. Without a cache it is only on with AOC_CACHE=1.
+    if cache is None and os.environ.get(ENABLE_VARIABLE, "") in ("", "0"):
+        return function
+    import inspect  # slow to import, and only the decorator needs it
+
+    results = cache or ResultCache()
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        source = sources_digest(Path(inspect.getfile(function)))
+        key = ResultCache.key(source, arguments=(args, sorted(kwargs.items())))
+        return results.get_or_compute(key, lambda: function(*args, **kwargs))
+
+    return wrapper
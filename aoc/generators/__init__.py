@@ -0,0 +1,20 @@
+import importlib
+from types import ModuleType
+from typing import Optional
+
+DAYS = range(1, 21)
+
+
+def _generator(day: int) -> ModuleType:
+    if day not in DAYS:
+        raise ValueError(f"There is no generator for day {day}")
+    return importlib.import_module(f"aoc.generators.day{day:02}")
+
+
+def puzzle_size(day: int) -> int:
+    return _generator(day).PUZZLE_SIZE
+
+
+def generate(day: int, size: Optional[int] = None, seed: int = 0) -> str:
+    generator = _generator(day)
+    return generator.generate(generator.PUZZLE_SIZE if size is None else size, seed)
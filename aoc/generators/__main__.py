@@ -0,0 +1,24 @@
+import argparse
+import sys
+
+from aoc.generators import generate, puzzle_size
+
+parser = argparse.ArgumentParser(
+    prog="python -m aoc.generators", description="Generate a puzzle input."
+)
+parser.add_argument("day", type=int)
+size = parser.add_mutually_exclusive_group()
+size.add_argument("--size", type=int, help="size in the day's own unit")
+size.add_argument(
+    "--scale", type=float, default=1, help="multiple of the real puzzle size"
+)
+parser.add_argument("--seed", type=int, default=0)
+args = parser.parse_args()
+
+sys.stdout.write(
+    generate(
+        args.day,
+        args.size or max(1, round(puzzle_size(args.day) * args.scale)),
+        args.seed,
+    )
+)
@@ -0,0 +1,45 @@
+import random
+from typing import List
+
+PUZZLE_SIZE = 200  # expenses
+
+TARGET_SUM = 2020
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Every filler is bigger than half the target, so no two or three of them can
+    # add up to it: the only pair and the only triple are the planted ones.
+    rng = random.Random(seed)
+    pair_low = rng.randrange(1, TARGET_SUM // 2)
+    while True:
+        triple = rng.sample(range(300, TARGET_SUM // 2), 2)
+        triple.append(TARGET_SUM - sum(triple))
+        planted = [pair_low, TARGET_SUM - pair_low, *triple]
+        small = [pair_low, *triple]
+        if len(set(planted)) == 5 and _only_planted_sums(planted):
+            break
+
+    forbidden = {TARGET_SUM - s for s in small} | {
+        TARGET_SUM - s1 - s2 for s1 in small for s2 in small if s1 != s2
+    }
+    fillers = [n for n in range(TARGET_SUM // 2 + 1, TARGET_SUM) if n not in forbidden]
+    expenses = planted + [rng.choice(fillers) for _ in range(max(0, size - 5))]
+    rng.shuffle(expenses)
+    return "\n".join(str(expense) for expense in expenses)
+
+
+def _only_planted_sums(planted: List[int]) -> bool:
+    pairs = sum(
+        1
+        for i, a in enumerate(planted)
+        for b in planted[i + 1 :]
+        if a + b == TARGET_SUM
+    )
+    triples = sum(
+        1
+        for i, a in enumerate(planted)
+        for j, b in enumerate(planted[i + 1 :], i + 1)
+        for c in planted[j + 1 :]
+        if a + b + c == TARGET_SUM
+    )
+    return pairs == 1 and triples == 1
@@ -0,0 +1,22 @@
+import random
+import string
+
+PUZZLE_SIZE = 1000  # password lines
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n".join(_password_line(rng) for _ in range(size))
+
+
+def _password_line(rng: random.Random) -> str:
+    length = rng.randint(5, 20)
+    low = rng.randint(1, length - 1)
+    high = rng.randint(low + 1, length)
+    letter = rng.choice(string.ascii_lowercase)
+    # Bias the password towards the policy letter so both outcomes are frequent
+    password = "".join(
+        letter if rng.random() < 0.4 else rng.choice(string.ascii_lowercase)
+        for _ in range(length)
+    )
+    return f"{low}-{high} {letter}: {password}"
@@ -0,0 +1,13 @@
+import random
+
+PUZZLE_SIZE = 323  # map rows
+
+WIDTH = 31
+
+
+def generate(size: int, seed: int = 0, width: int = WIDTH) -> str:
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join("#" if rng.random() < 0.2 else "." for _ in range(width))
+        for _ in range(size)
+    )
@@ -0,0 +1,73 @@
+import random
+import string
+from typing import Callable, Dict
+
+PUZZLE_SIZE = 276  # passports
+
+EYE_COLORS = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+
+
+def _hex_color(rng: random.Random) -> str:
+    return "#" + "".join(rng.choice("0123456789abcdef") for _ in range(6))
+
+
+def _digits(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(string.digits) for _ in range(length))
+
+
+VALID_FIELDS: Dict[str, Callable[[random.Random], str]] = {
+    "byr": lambda rng: str(rng.randint(1920, 2002)),
+    "iyr": lambda rng: str(rng.randint(2010, 2020)),
+    "eyr": lambda rng: str(rng.randint(2020, 2030)),
+    "hgt": lambda rng: rng.choice(
+        [f"{rng.randint(150, 193)}cm", f"{rng.randint(59, 76)}in"]
+    ),
+    "hcl": _hex_color,
+    "ecl": lambda rng: rng.choice(EYE_COLORS),
+    "pid": lambda rng: _digits(rng, 9),
+    "cid": lambda rng: str(rng.randint(50, 350)),
+}
+
+INVALID_FIELDS: Dict[str, Callable[[random.Random], str]] = {
+    "byr": lambda rng: str(
+        rng.choice([rng.randint(1900, 1919), rng.randint(2003, 2030)])
+    ),
+    "iyr": lambda rng: str(
+        rng.choice([rng.randint(1920, 2009), rng.randint(2021, 2030)])
+    ),
+    "eyr": lambda rng: str(
+        rng.choice([rng.randint(1920, 2019), rng.randint(2031, 2040)])
+    ),
+    "hgt": lambda rng: rng.choice(
+        [
+            f"{rng.randint(59, 76)}cm",
+            f"{rng.randint(150, 193)}in",
+            str(rng.randint(59, 193)),
+        ]
+    ),
+    "hcl": lambda rng: rng.choice([_hex_color(rng)[1:], "#" + _digits(rng, 5) + "z"]),
+    "ecl": lambda rng: rng.choice(["gmt", "xry", "#" + _digits(rng, 6)]),
+    "pid": lambda rng: _digits(rng, rng.choice([8, 10])),
+    "cid": lambda rng: str(rng.randint(50, 350)),
+}
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n\n".join(_passport(rng) for _ in range(size))
+
+
+def _passport(rng: random.Random) -> str:
+    fields = []
+    for field in VALID_FIELDS:
+        if rng.random() < 0.08:
+            continue  # missing field
+        builder = INVALID_FIELDS if rng.random() < 0.05 else VALID_FIELDS
+        fields.append(f"{field}:{builder[field](rng)}")
+    if not fields:
+        fields.append(f"byr:{VALID_FIELDS['byr'](rng)}")  # blank records end the batch
+    rng.shuffle(fields)
+    return "".join(
+        field + (rng.choice(" \n") if i < len(fields) - 1 else "")
+        for i, field in enumerate(fields)
+    )
@@ -0,0 +1,27 @@
+import random
+
+PUZZLE_SIZE = 789  # boarding passes
+
+COLUMN_LETTERS = 3
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Boarding passes for a full flight but one seat, missing some seats at the
+    # very front and back. Planes bigger than 128 rows get longer row codes.
+    rng = random.Random(seed)
+    size = max(size, 2)  # the missing seat needs a neighbour at each side
+    row_letters = max(7, (size + 1).bit_length() - COLUMN_LETTERS)
+    capacity = 2 ** (row_letters + COLUMN_LETTERS)
+    first = rng.randint(1, capacity - size - 1)
+    last = first + size  # size seats plus the missing one
+    missing = rng.randint(first + 1, last - 1)
+    seat_ids = [seat_id for seat_id in range(first, last + 1) if seat_id != missing]
+    rng.shuffle(seat_ids)
+    return "\n".join(_boarding_pass(seat_id, row_letters) for seat_id in seat_ids)
+
+
+def _boarding_pass(seat_id: int, row_letters: int) -> str:
+    row, col = divmod(seat_id, 2 ** COLUMN_LETTERS)
+    return f"{row:0{row_letters}b}".translate(
+        str.maketrans("01", "FB")
+    ) + f"{col:0{COLUMN_LETTERS}b}".translate(str.maketrans("01", "LR"))
@@ -0,0 +1,23 @@
+import random
+import string
+
+PUZZLE_SIZE = 473  # groups
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n\n".join(_group(rng) for _ in range(size))
+
+
+def _group(rng: random.Random) -> str:
+    # People in a group share most of their answers, like in the real input
+    letters = rng.sample(string.ascii_lowercase, rng.randint(2, 20))
+    common, extra = letters[: len(letters) // 2 + 1], letters[len(letters) // 2 + 1 :]
+    return "\n".join(
+        "".join(
+            rng.sample(common, rng.randint(len(common) // 2, len(common)))
+            + rng.sample(extra, rng.randint(0, len(extra)))
+        )
+        or common[0]
+        for _ in range(rng.randint(1, 5))
+    )
@@ -0,0 +1,78 @@
+import random
+from itertools import count
+from typing import Dict, List
+
+PUZZLE_SIZE = 594  # rules
+
+TARGET_BAG = "shiny gold"
+
+# fmt: off
+ADJECTIVES = [
+    "bright", "clear", "dark", "dim", "dotted", "drab", "dull", "faded", "light",
+    "mirrored", "muted", "pale", "plaid", "posh", "shiny", "striped", "vibrant",
+    "wavy",
+]
+COLORS = [
+    "aqua", "beige", "black", "blue", "bronze", "brown", "chartreuse", "coral",
+    "crimson", "cyan", "fuchsia", "gold", "gray", "green", "indigo", "lavender",
+    "lime", "magenta", "maroon", "olive", "orange", "plum", "purple", "red",
+    "salmon", "silver", "tan", "teal", "tomato", "turquoise", "violet", "white",
+    "yellow",
+]
+# fmt: on
+
+
+def bag_names(size: int) -> List[str]:
+    # Real names run out at 594 bags, then adjectives get a number: "dull2 red"
+    names = (
+        f"{adjective}{suffix or ''} {color}"
+        for suffix in count()
+        for adjective in ADJECTIVES
+        for color in COLORS
+    )
+    return [next(names) for _ in range(size)]
+
+
+def generate(size: int, seed: int = 0, levels: int = 8) -> str:
+    # A layered DAG: bags only contain bags of the next level, so the number of
+    # paths (and the totals) stay bounded by the number of levels.
+    rng = random.Random(seed)
+    size = max(size, levels)
+    others = [name for name in bag_names(size + 1) if name != TARGET_BAG]
+    others = others[: size - 1]
+    rng.shuffle(others)
+    target_level = levels // 2
+    names = others[:target_level] + [TARGET_BAG] + others[target_level:]
+    layers = [names[level::levels] for level in range(levels)]
+
+    contents: Dict[str, Dict[str, int]] = {}
+    for level, layer in enumerate(layers):
+        for bag in layer:
+            if level == levels - 1 or rng.random() < 0.02:
+                contents[bag] = {}
+                continue
+            children = rng.sample(
+                layers[level + 1], min(rng.randint(1, 4), len(layers[level + 1]))
+            )
+            contents[bag] = {child: rng.randint(1, 5) for child in children}
+    for parent in rng.sample(
+        layers[target_level - 1], min(3, len(layers[target_level - 1]))
+    ):
+        contents[parent][TARGET_BAG] = rng.randint(1, 5)
+
+    rules = [_rule(bag, contents[bag]) for bag in names]
+    rng.shuffle(rules)
+    return "\n".join(rules)
+
+
+def _rule(bag: str, contents: Dict[str, int]) -> str:
+    if not contents:
+        return f"{bag} bags contain no other bags."
+    return (
+        f"{bag} bags contain "
+        + ", ".join(
+            f"{quantity} {child} bag{'s' if quantity > 1 else ''}"
+            for child, quantity in contents.items()
+        )
+        + "."
+    )
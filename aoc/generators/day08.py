@@ -0,0 +1,28 @@
+import random
+from typing import List, Tuple
+
+PUZZLE_SIZE = 596  # instructions
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # One corrupted jmp loops back, and nothing before it can jump over it, so
+    # every run reaches the loop until exactly that jmp is turned into a nop.
+    rng = random.Random(seed)
+    size = max(size, 2)
+    corrupted = rng.randint(size // 2, size - 1)
+    instructions: List[Tuple[str, int]] = []
+    for index in range(size):
+        limit = corrupted if index < corrupted else size
+        if index == corrupted:
+            instructions.append(("jmp", -rng.randint(1, corrupted)))
+        elif index < corrupted and rng.random() < 0.1:
+            instructions.append(("nop", rng.randint(-index, limit - index)))
+        elif index > corrupted and rng.random() < 0.1:
+            instructions.append(("nop", rng.randint(-index, size - index)))
+        elif rng.random() < 0.3:
+            instructions.append(("jmp", rng.randint(1, min(limit - index, 20))))
+        else:
+            instructions.append(("acc", rng.randint(-50, 50)))
+    return "\n".join(
+        f"{operation} {argument:+d}" for operation, argument in instructions
+    )
@@ -0,0 +1,34 @@
+import random
+from itertools import combinations
+from typing import List
+
+PUZZLE_SIZE = 1000  # numbers
+
+PREAMBLE = 25
+
+
+def generate(size: int, seed: int = 0, preamble: int = PREAMBLE) -> str:
+    # Every number is the sum of two of the previous ones, except one planted
+    # number that is the sum of a contiguous run instead. Adding up the smaller
+    # half of the window keeps the growth close to the real input's.
+    rng = random.Random(seed)
+    size = max(size, preamble + 3)
+    numbers = rng.sample(range(1, 4 * preamble), preamble)
+    invalid_index = rng.randint(max(preamble, size // 2), size - 1)
+    for index in range(preamble, size):
+        window = numbers[index - preamble : index]
+        if index == invalid_index:
+            numbers.append(_weakness_sum(rng, numbers, window))
+        else:
+            numbers.append(sum(rng.sample(sorted(window)[: preamble // 2], 2)))
+    return "\n".join(str(number) for number in numbers)
+
+
+def _weakness_sum(rng: random.Random, numbers: List[int], window: List[int]) -> int:
+    sums = {n1 + n2 for n1, n2 in combinations(window, 2)}
+    while True:
+        start = rng.randrange(0, len(numbers) - 2)
+        end = rng.randint(start + 2, min(start + 17, len(numbers)))
+        candidate = sum(numbers[start:end])
+        if candidate not in sums:
+            return candidate
@@ -0,0 +1,17 @@
+import random
+
+PUZZLE_SIZE = 103  # adapters
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Only differences of 1 and 3 jolts, with runs of ones no longer than four
+    rng = random.Random(seed)
+    adapters = []
+    joltage, ones = 0, 0
+    for _ in range(size):
+        step = 1 if ones < 4 and rng.random() < 0.65 else 3
+        ones = ones + 1 if step == 1 else 0
+        joltage += step
+        adapters.append(joltage)
+    rng.shuffle(adapters)
+    return "\n".join(str(adapter) for adapter in adapters)
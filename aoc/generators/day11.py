@@ -0,0 +1,75 @@
+import random
+from typing import List, Optional, Set, Tuple
+
+PUZZLE_SIZE = 98  # rows
+
+WIDTH = 95
+
+Seat = Tuple[int, int]
+DIRECTIONS = [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1) if i or j]
+
+
+def generate(size: int, seed: int = 0, width: int = WIDTH) -> str:
+    # Random layouts often end up blinking between two states forever, so the
+    # blinking seats are turned into floor until both parts' rules settle.
+    rng = random.Random(seed)
+    rows = [
+        ["." if rng.random() < 0.2 else "L" for _ in range(width)] for _ in range(size)
+    ]
+    while True:
+        blinking = _blinking_seats(rows, 1, 4) | _blinking_seats(rows, None, 5)
+        if not blinking:
+            return "\n".join("".join(row) for row in rows)
+        for i, j in blinking:
+            rows[i][j] = "."
+
+
+def _blinking_seats(
+    rows: List[List[str]], reach: Optional[int], tolerance: int
+) -> Set[Seat]:
+    seats = [
+        (i, j)
+        for i, row in enumerate(rows)
+        for j, cell in enumerate(row)
+        if cell == "L"
+    ]
+    neighbours = _neighbours(rows, seats, reach)
+    occupied = [False] * len(seats)
+    previous: List[bool] = []
+    for _ in range(10 * len(rows) + 100):
+        new = [
+            sum(occupied[n] for n in seen) < tolerance
+            if is_occupied
+            else not any(occupied[n] for n in seen)
+            for is_occupied, seen in zip(occupied, neighbours)
+        ]
+        if new == occupied:
+            return set()
+        if new == previous:
+            break
+        previous, occupied = occupied, new
+    else:
+        new = previous  # never settled, assume it blinks
+    return {seat for seat, a, b in zip(seats, new, occupied) if a != b}
+
+
+def _neighbours(
+    rows: List[List[str]], seats: List[Seat], reach: Optional[int]
+) -> List[List[int]]:
+    # reach=1 is the adjacent seats rule, reach=None the first seat in sight
+    index = {seat: n for n, seat in enumerate(seats)}
+    height, width = len(rows), len(rows[0])
+    neighbours = []
+    for i, j in seats:
+        seen = []
+        for di, dj in DIRECTIONS:
+            y, x, steps = i + di, j + dj, 1
+            while 0 <= y < height and 0 <= x < width:
+                if rows[y][x] == "L":
+                    seen.append(index[(y, x)])
+                    break
+                if reach is not None and steps >= reach:
+                    break
+                y, x, steps = y + di, x + dj, steps + 1
+        neighbours.append(seen)
+    return neighbours
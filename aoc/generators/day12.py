@@ -0,0 +1,15 @@
+import random
+
+PUZZLE_SIZE = 780  # navigation instructions
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n".join(_action(rng) for _ in range(size))
+
+
+def _action(rng: random.Random) -> str:
+    action = rng.choice("NSEWLRFF")
+    if action in "LR":
+        return f"{action}{rng.choice([90, 90, 180, 270])}"
+    return f"{action}{rng.randint(1, 100)}"
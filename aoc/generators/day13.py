@@ -0,0 +1,27 @@
+import math
+import random
+from itertools import count
+from typing import Iterator
+
+PUZZLE_SIZE = 102  # slots in the bus schedule
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Bus IDs are distinct primes, so the earliest timestamp always exists
+    rng = random.Random(seed)
+    size = max(size, 2)
+    buses = max(2, size // 11)
+    primes = _primes()
+    ids = [next(primes) for _ in range(buses + rng.randint(0, 5))][-buses:]
+    rng.shuffle(ids)
+    slots = ["x"] * size
+    positions = [0] + sorted(rng.sample(range(1, size), buses - 1))
+    for position, bus_id in zip(positions, ids):
+        slots[position] = str(bus_id)
+    return f"{rng.randint(10 ** 5, 10 ** 6)}\n{','.join(slots)}"
+
+
+def _primes() -> Iterator[int]:
+    for candidate in count(13):
+        if all(candidate % divisor for divisor in range(2, math.isqrt(candidate) + 1)):
+            yield candidate
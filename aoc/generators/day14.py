@@ -0,0 +1,28 @@
+import random
+from typing import List
+
+PUZZLE_SIZE = 578  # lines
+
+MASK_LEN = 36
+
+
+def generate(size: int, seed: int = 0, floating: int = 9) -> str:
+    # At most `floating` X bits per mask, so part two writes 2^floating addresses
+    rng = random.Random(seed)
+    lines: List[str] = []
+    while len(lines) < size:
+        lines.append(f"mask = {_mask(rng, floating)}")
+        lines.extend(
+            f"mem[{rng.randrange(2 ** 16)}] = {rng.randrange(2 ** 30)}"
+            for _ in range(rng.randint(1, 6))
+        )
+    return "\n".join(lines[:size])
+
+
+def _mask(rng: random.Random, floating: int) -> str:
+    mask = [rng.choice("01") for _ in range(MASK_LEN)]
+    for index in rng.sample(
+        range(MASK_LEN), rng.randint(max(0, floating - 5), floating)
+    ):
+        mask[index] = "X"
+    return "".join(mask)
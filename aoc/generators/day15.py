@@ -0,0 +1,8 @@
+import random
+
+PUZZLE_SIZE = 6  # starting numbers
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return ",".join(str(n) for n in rng.sample(range(max(20, 2 * size)), size))
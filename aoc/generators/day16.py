@@ -0,0 +1,69 @@
+import random
+from typing import List
+
+PUZZLE_SIZE = 241  # nearby tickets
+
+# fmt: off
+FIELDS = [
+    "departure location", "departure station", "departure platform",
+    "departure track", "departure date", "departure time", "arrival location",
+    "arrival station", "arrival platform", "arrival track", "class", "duration",
+    "price", "route", "row", "seat", "train", "type", "wagon", "zone",
+]
+
+BASE = 25
+BAND = 40
+UNUSED = 5  # first values of every band, never written on a ticket
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Each column draws its values from its own band, and the field of rank r
+    # accepts every band from r on. Column r then fits exactly r + 1 fields, so
+    # solving the fields from the most constrained column on is unambiguous.
+    rng = random.Random(seed)
+    ranks = len(FIELDS)
+    names = FIELDS.copy()
+    rng.shuffle(names)
+    column_ranks = list(range(ranks))
+    rng.shuffle(column_ranks)
+
+    validations = [_validation(rng, name, rank, ranks) for rank, name in enumerate(names)]
+    rng.shuffle(validations)
+    my_ticket = _ticket(rng, column_ranks)
+    nearby = [_ticket(rng, column_ranks) for _ in range(size)]
+    for ticket in nearby:
+        if rng.random() < 0.2:
+            ticket[rng.randrange(ranks)] = rng.choice(
+                [rng.randint(1, BASE - 1), rng.randint(_start(ranks), _start(ranks) + 50)]
+            )
+    return "\n".join(
+        [
+            *validations,
+            "",
+            "your ticket:",
+            ",".join(map(str, my_ticket)),
+            "",
+            "nearby tickets:",
+            *(",".join(map(str, ticket)) for ticket in nearby),
+        ]
+    )
+
+
+def _start(rank: int) -> int:
+    return BASE + rank * BAND
+
+
+def _validation(rng: random.Random, name: str, rank: int, ranks: int) -> str:
+    low, high = _start(rank) + rng.randint(0, UNUSED), _start(ranks) - 1
+    if rank == ranks - 1:
+        split = rng.randint(low + 1, high - 1)
+        return f"{name}: {low}-{split} or {split + 1}-{high}"
+    gap_band = rng.randint(rank + 1, ranks - 1)
+    return f"{name}: {low}-{_start(gap_band) - 1} or {_start(gap_band) + rng.randint(1, UNUSED)}-{high}"
+
+
+def _ticket(rng: random.Random, column_ranks: List[int]) -> List[int]:
+    return [
+        rng.randint(_start(rank) + UNUSED, _start(rank + 1) - 1)
+        for rank in column_ranks
+    ]
@@ -0,0 +1,11 @@
+import random
+
+PUZZLE_SIZE = 8  # side of the initial slice
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join("#" if rng.random() < 0.45 else "." for _ in range(size))
+        for _ in range(size)
+    )
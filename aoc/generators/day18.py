@@ -0,0 +1,21 @@
+import random
+
+PUZZLE_SIZE = 378  # expressions
+
+
+def generate(size: int, seed: int = 0, depth: int = 3) -> str:
+    rng = random.Random(seed)
+    return "\n".join(_expression(rng, depth) for _ in range(size))
+
+
+def _expression(rng: random.Random, depth: int) -> str:
+    terms = [_term(rng, depth) for _ in range(rng.randint(2, 6))]
+    return " ".join(
+        term if i == 0 else f"{rng.choice('+*')} {term}" for i, term in enumerate(terms)
+    )
+
+
+def _term(rng: random.Random, depth: int) -> str:
+    if depth and rng.random() < 0.25:
+        return f"({_expression(rng, depth - 1)})"
+    return str(rng.randint(2, 9))
@@ -0,0 +1,69 @@
+import random
+from typing import Dict, List
+
+PUZZLE_SIZE = 468  # messages
+
+CHUNK_DEPTH = 3  # rules 42 and 31 match 2^3 = 8 letters
+
+
+def generate(size: int, seed: int = 0, width: int = 10) -> str:
+    # Rules 0, 8 and 11 have the real shape, rules 42 and 31 are random binary
+    # grammars. Messages are a mix of 42^m 31^n chunks and random noise.
+    rng = random.Random(seed)
+    ids = [
+        n for n in range(1, 3 * width * CHUNK_DEPTH + 10) if n not in (8, 11, 31, 42)
+    ]
+    rng.shuffle(ids)
+    rules: Dict[int, List[List[int]]] = {}
+    letter_a, letter_b = ids.pop(), ids.pop()
+    level = [letter_a, letter_b]
+    for _ in range(1, CHUNK_DEPTH):
+        next_level = []
+        for _ in range(width):
+            rule = ids.pop()
+            rules[rule] = _alternatives(rng, level)
+            next_level.append(rule)
+        level = next_level
+    rules[42] = _alternatives(rng, level)
+    rules[31] = _alternatives(rng, level)
+
+    def sample(rule: int) -> str:
+        if rule == letter_a:
+            return "a"
+        if rule == letter_b:
+            return "b"
+        return "".join(sample(part) for part in rng.choice(rules[rule]))
+
+    messages = []
+    for _ in range(size):
+        thirty_ones = rng.randint(1, 3)
+        forty_twos = rng.randint(thirty_ones - 1, thirty_ones + 3)
+        if rng.random() < 0.3:
+            messages.append(
+                "".join(rng.choice("ab") for _ in range(8 * (forty_twos + thirty_ones)))
+            )
+        else:
+            messages.append(
+                "".join(
+                    [sample(42) for _ in range(forty_twos)]
+                    + [sample(31) for _ in range(thirty_ones)]
+                )
+            )
+
+    rule_lines = [
+        f'{letter_a}: "a"',
+        f'{letter_b}: "b"',
+        "0: 8 11",
+        "8: 42",
+        "11: 42 31",
+    ]
+    rule_lines += [
+        f"{rule}: " + " | ".join(" ".join(map(str, parts)) for parts in alternatives)
+        for rule, alternatives in rules.items()
+    ]
+    rng.shuffle(rule_lines)
+    return "\n".join(rule_lines) + "\n\n" + "\n".join(messages)
+
+
+def _alternatives(rng: random.Random, level: List[int]) -> List[List[int]]:
+    return [rng.choices(level, k=2) for _ in range(rng.randint(1, 2))]
@@ -0,0 +1,72 @@
+import math
+import random
+from typing import List, Set, Tuple
+
+PUZZLE_SIZE = 144  # tiles, rounded down to a square
+
+TILE_SIDE = 10
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Tiles are cut from one big image, sharing their borders with the
+    # neighbours. Every border is unique (reversed included), so only real
+    # neighbours match. Tiles grow beyond 10x10 when there are not enough
+    # unique borders for the requested size.
+    rng = random.Random(seed)
+    side = max(2, math.isqrt(size))
+    edges = 2 * side * (side + 1)
+    tile_side = TILE_SIDE
+    while edges > 0.75 * 2 ** (tile_side - 1):
+        tile_side += 1
+    step = tile_side - 1
+    image = [
+        [rng.choice("#.") for _ in range(side * step + 1)]
+        for _ in range(side * step + 1)
+    ]
+
+    used: Set[str] = set()
+    for i in range(side + 1):
+        for j in range(side):
+            _unique_border(
+                rng, used, [(i * step, j * step + k) for k in range(tile_side)], image
+            )
+    for i in range(side):
+        for j in range(side + 1):
+            _unique_border(
+                rng, used, [(i * step + k, j * step) for k in range(tile_side)], image
+            )
+
+    tile_ids = rng.sample(range(1000, max(10000, 10 * side * side)), side * side)
+    tiles = []
+    for tile_id, (i, j) in zip(
+        tile_ids, ((i, j) for i in range(side) for j in range(side))
+    ):
+        rows = [
+            "".join(row[j * step : j * step + tile_side])
+            for row in image[i * step : i * step + tile_side]
+        ]
+        tiles.append(f"Tile {tile_id}:\n" + "\n".join(_random_orientation(rng, rows)))
+    rng.shuffle(tiles)
+    return "\n\n".join(tiles)
+
+
+def _unique_border(
+    rng: random.Random,
+    used: Set[str],
+    cells: List[Tuple[int, int]],
+    image: List[List[str]],
+) -> None:
+    # Corners are shared with the crossing borders, only the inner cells are redrawn
+    while True:
+        border = "".join(image[i][j] for i, j in cells)
+        if border not in used and border[::-1] not in used:
+            used.update((border, border[::-1]))
+            return
+        for i, j in cells[1:-1]:
+            image[i][j] = rng.choice("#.")
+
+
+def _random_orientation(rng: random.Random, rows: List[str]) -> List[str]:
+    for _ in range(rng.randrange(4)):
+        rows = ["".join(row) for row in zip(*rows[::-1])]
+    return [row[::-1] for row in rows] if rng.random() < 0.5 else rows
@@ -0,0 +1,124 @@
+from importlib import import_module
+
+import pytest
+
+from aoc.generators import DAYS, generate, puzzle_size
+from aoc.inputs import group_lines
+from test_day01.test_ex1 import expense_report
+from test_day01.test_ex2 import expense_report_v2
+from test_day05.test_ex10 import letters_to_position
+from test_day07.test_ex14 import (
+    line_to_rule,
+    rules_to_graph,
+    count_total_contained_bags,
+)
+from test_day08 import test_ex16 as day08
+from test_day09.test_ex18 import find_invalid_number, find_encryption_weakness
+from test_day11 import test_ex21 as day11_part1, test_ex22 as day11_part2
+from test_day16.test_ex32 import (
+    TicketValidation,
+    find_invalid_ticket_fields,
+    guess_field_order,
+)
+from test_day20.test_ex39 import Tile
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_generate_is_deterministic(day):
+    assert generate(day, 20, seed=1) == generate(day, 20, seed=1)
+    assert generate(day, 20, seed=1) != generate(day, 20, seed=2)
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_generate_puzzle_size_by_default(day, monkeypatch):
+    assert puzzle_size(day) > 0
+    monkeypatch.setattr(import_module(f"aoc.generators.day{day:02}"), "PUZZLE_SIZE", 9)
+    assert generate(day) == generate(day, 9)
+
+
+def test_unknown_day():
+    with pytest.raises(ValueError):
+        generate(25)
+
+
+def test_expenses_have_one_pair_and_one_triple():
+    expenses = [int(line) for line in generate(1, 200, seed=3).splitlines()]
+    assert len(expenses) == 200
+    assert expense_report(expenses) > 0
+    assert expense_report_v2(expenses) > 0
+
+
+def test_boarding_passes_miss_one_inner_seat():
+    for size in (100, 5000):
+        seat_ids = {letters_to_position(line) for line in generate(5, size).split()}
+        missing = set(range(min(seat_ids), max(seat_ids))) - seat_ids
+        assert len(seat_ids) == size
+        assert len(missing) == 1
+
+
+def test_bag_rules_contain_shiny_gold():
+    rules = [line_to_rule(line) for line in generate(7, 3000, seed=4).splitlines()]
+    assert len(rules) == 3000
+    assert count_total_contained_bags(rules_to_graph(rules), "shiny gold") > 0
+
+
+def test_program_has_one_fix():
+    instructions = [
+        day08.line_to_instruction(line) for line in generate(8, 2000).splitlines()
+    ]
+    with pytest.raises(day08.InfiniteLoopError):
+        day08.Program(instructions).execute()
+    day08.Program(day08.sanitize_instructions(instructions)).execute()
+
+
+def test_seat_layouts_settle():
+    rows = generate(11, 10, seed=8).splitlines()
+    for part in (day11_part1, day11_part2):
+        layout = part.SeatLayout(rows)
+        for _ in range(200):
+            next_layout = layout.get_next_state()
+            if next_layout == layout:
+                break
+            layout = next_layout
+        else:
+            pytest.fail(f"{part.__name__} never settles")
+
+
+def test_numbers_have_an_encryption_weakness():
+    numbers = [int(line) for line in generate(9, 400, seed=5).splitlines()]
+    invalid_number = find_invalid_number(numbers)
+    assert find_encryption_weakness(numbers, invalid_number) > 0
+
+
+def test_ticket_fields_can_be_guessed():
+    validations, tickets = [], []
+    for line in generate(16, 200, seed=6).splitlines():
+        if line and line[0].isnumeric():
+            tickets.append([int(field) for field in line.split(",")])
+        elif line and not line.endswith(":"):
+            validations.append(TicketValidation.build_from_line(line))
+    valid_tickets = [
+        t for t in tickets if not find_invalid_ticket_fields(t, validations)
+    ]
+    assert 0 < len(valid_tickets) < len(tickets)
+    field_names = guess_field_order(valid_tickets, validations)
+    assert sorted(field_names) == sorted(v.name for v in validations)
+    for ticket in valid_tickets:
+        for field, name in zip(ticket, field_names):
+            assert next(v for v in validations if v.name == name).is_valid(field)
+
+
+def test_tiles_have_four_corners():
+    tiles = [
+        Tile.from_chunk_of_lines(chunk)
+        for chunk in group_lines(generate(20, 49, seed=7).splitlines())
+    ]
+    for tile1 in tiles:
+        for tile2 in tiles:
+            if tile1.is_adjacent_tile(tile2):
+                tile1.add_adjacent_tile(tile2)
+    assert len(tiles) == 49
+    assert (
+        sorted(len(tile.adjacent_tiles) for tile in tiles)
+        == [2] * 4 + [3] * 20 + [4] * 25
+    )
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List
+
+from aoc.runner import ROOT, Solution
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    own: float  # seconds spent in the module itself
+    cumulative: float  # seconds including everything it imported
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTime]:
+    # "import time: self [us] | cumulative | imported package", children come
+    # before their parent and are indented two more spaces
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if not own.strip().isdigit():
+            continue  # the header
+        times.append(
+            ImportTime(
+                module=name.strip(),
+                own=int(own) / 1e6,
+                cumulative=int(cumulative) / 1e6,
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return times
+
+
+def import_times(module: str) -> List[ImportTime]:
+    # A fresh interpreter every time, the report is about cold starts
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(process.stderr)
+
+
+def solution_module(solution: Solution) -> str:
+    return f"{solution.path.parent.name}.{solution.path.stem}"
+
+
+def heaviest_imports(times: List[ImportTime], module: str) -> List[ImportTime]:
+    # The module and everything it imported directly, slowest first
+    end = next(i for i, time in enumerate(times) if time.module == module)
+    depth = times[end].depth
+    start = end
+    while start > 0 and times[start - 1].depth > depth:
+        start -= 1
+    children = [time for time in times[start:end] if time.depth == depth + 1]
+    return [times[end]] + sorted(children, key=lambda time: -time.cumulative)
+
+
+def format_imports(name: str, imports: List[ImportTime], top: int = 5) -> str:
+    module, children = imports[0], imports[1 : top + 1]
+    lines = [f"{name}  import {module.cumulative * 1000:.1f}ms ({module.module})"]
+    lines += [
+        f"  {child.cumulative * 1000:>8.1f}ms  {child.module}" for child in children
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,99 @@
+import contextlib
+import itertools
+import mmap
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+NEWLINE = ord("\n")
+
+
+def input_path(module_file: str) -> Path:
+    return Path(module_file).parent / "input.txt"
+
+
+@contextlib.contextmanager
+def mapped(path: Path) -> Iterator[Buffer]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # empty files can't be mapped
+            return
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        data.madvise(mmap.MADV_SEQUENTIAL)
+    try:
+        yield data
+    finally:
+        try:
+            data.close()
+        except BufferError:
+            pass  # someone kept a slice, the map is released along with it
+
+
+def split_lines(data: Buffer) -> Iterator[memoryview]:
+    view = memoryview(data)
+    start, end = 0, len(data)
+    while start < end:
+        stop = data.find(b"\n", start)
+        if stop == -1:
+            stop = end
+        yield view[start:stop]
+        start = stop + 1
+
+
+def split_records(
+    data: Buffer, start: int = 0, end: Optional[int] = None
+) -> Iterator[memoryview]:
+    # Records are separated by blank lines, every record keeps its inner "\n"
+    view = memoryview(data)
+    end = len(data) if end is None else end
+    while start < end:
+        if data[start] == NEWLINE:  # extra blank lines
+            start += 1
+            continue
+        stop = data.find(b"\n\n", start, end)
+        if stop == -1:
+            stop = end - 1 if data[end - 1] == NEWLINE else end
+        yield view[start:stop]
+        start = stop + 2
+
+
+def chunk_records(data: Buffer, chunks: int) -> List[Tuple[int, int]]:
+    # (start, end) offsets of about len(data) / chunks bytes each, every cut is
+    # moved forward to the next blank line so no record is split between chunks
+    bounds = [0]
+    for i in range(1, chunks):
+        cut = data.find(b"\n\n", max(bounds[-1], len(data) * i // chunks))
+        if cut == -1:
+            break
+        bounds.append(cut + 2)
+    bounds.append(len(data))
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def decode_record(record: memoryview) -> List[str]:
+    return str(record, "utf-8").split("\n")
+
+
+def group_lines(lines: Iterable[str]) -> Iterator[List[str]]:
+    # Same records as split_records, for lines that are already strings
+    for is_record, record in itertools.groupby(lines, key=bool):
+        if is_record:
+            yield list(record)
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    with mapped(path) as data:
+        yield from (str(line, "utf-8") for line in split_lines(data))
+
+
+def read_ints(path: Path) -> Iterator[int]:
+    with mapped(path) as data:
+        yield from (int(line.tobytes()) for line in split_lines(data))
+
+
+def read_records(path: Path) -> Iterator[List[str]]:
+    with mapped(path) as data:
+        yield from (decode_record(record) for record in split_records(data))
@@ -0,0 +1,76 @@
+import contextlib
+import io
+import runpy
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Tuple, TypeVar
+
+from aoc.runner import Solution
+
+T = TypeVar("T")
+
+# Interpreter machinery that allocates while the solver runs, but isn't it
+IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<frozen runpy>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    peak: int  # bytes, high-water mark of the traced memory
+    blocks: int  # memory blocks still allocated when the run finished
+    top: List[Tuple[str, int, int]]  # (file:line, bytes, blocks) biggest first
+
+
+def trace_memory(function: Callable[[], T], top: int = 10) -> Tuple[T, MemoryUsage]:
+    # The snapshot is taken while the result is still alive, so the lines that
+    # built it show up even if the solver released everything else
+    tracemalloc.start()
+    try:
+        result = function()
+        snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    statistics = snapshot.statistics("lineno")
+    usage = MemoryUsage(
+        peak=peak,
+        blocks=sum(statistic.count for statistic in statistics),
+        top=[
+            (
+                f"{Path(statistic.traceback[0].filename).name}:"
+                f"{statistic.traceback[0].lineno}",
+                statistic.size,
+                statistic.count,
+            )
+            for statistic in statistics[:top]
+        ],
+    )
+    return result, usage
+
+
+def trace_solution(solution: Solution, top: int = 10) -> MemoryUsage:
+    def run() -> Any:
+        with contextlib.redirect_stdout(io.StringIO()):
+            # The module globals keep the solver data alive for the snapshot
+            return runpy.run_path(str(solution.path), run_name="__main__")
+
+    _, usage = trace_memory(run, top)
+    return usage
+
+
+def format_usage(name: str, usage: MemoryUsage) -> str:
+    lines = [
+        f"{name}  peak {usage.peak / 1024 / 1024:.1f} MiB  "
+        f"{usage.blocks} blocks alive at the end"
+    ]
+    lines += [
+        f"  {size / 1024:>10.1f} KiB {count:>9} blocks  {line}"
+        for line, size, count in usage.top
+    ]
+    return "\n".join(lines)
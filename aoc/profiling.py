@@ -0,0 +1,78 @@
+import cProfile
+import io
+import pstats
+import signal
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from aoc.runner import Solution, execute_solution
+
+
+class SamplingProfiler:
+    # Every `interval` seconds of CPU time SIGPROF interrupts the main thread,
+    # and the handler counts the stack it interrupted. Stacks start at the
+    # first frame of `root` (the solution file), the runner frames are noise.
+    def __init__(self, interval: float = 0.001, root: Optional[str] = None) -> None:
+        self.interval = interval
+        self.root = root
+        self.stacks: Counter = Counter()
+
+    def __enter__(self) -> "SamplingProfiler":
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        stack.reverse()
+        if self.root is not None:
+            files = [code.co_filename for code in stack]
+            if self.root not in files:
+                return
+            stack = stack[files.index(self.root) :]
+        self.stacks[
+            ";".join(
+                f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                for code in stack
+            )
+        ] += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        # One "outer;...;inner count" line per stack, as flamegraph.pl expects
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def profile_solution(
+    solution: Solution,
+    directory: Path,
+    top: int = 15,
+    sample: bool = False,
+    interval: float = 0.001,
+) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"day{solution.day:02}-part{solution.part}"
+
+    profiler = cProfile.Profile()
+    profiler.runcall(execute_solution, solution)
+    profiler.dump_stats(str(directory / f"{stem}.pstats"))
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    if sample:
+        # Separate run, so cProfile overhead doesn't bend the samples
+        with SamplingProfiler(interval, str(solution.path)) as sampler:
+            execute_solution(solution)
+        sampler.write_collapsed(directory / f"{stem}.folded")
+    return f"{solution.name}\n{report.getvalue().strip()}\n"
@@ -0,0 +1,294 @@
+import argparse
+import contextlib
+import functools
+import io
+import json
+import math
+import os
+import resource
+import runpy
+import sys
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Optional, Sequence, Iterable, Iterator, Dict, Tuple
+
+from aoc.cache import ENABLE_VARIABLE, ResultCache, sources_digest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+Estimates = Dict[Tuple[int, int], float]
+
+HEADER = f"{'Day':>3} {'Part':>4}  {'Answer':<20} {'Wall (s)':>9} {'CPU (s)':>9} {'RSS (MiB)':>9}"
+
+
+@dataclass(frozen=True, order=True)
+class Solution:
+    day: int
+    part: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"day{self.day:02}/part{self.part}"
+
+
+@dataclass(frozen=True)
+class Timing:
+    day: int
+    part: int
+    answer: str
+    wall: float
+    cpu: float
+    peak_rss: int  # KiB, high-water mark of the process running the part
+    cached: bool = False
+
+
+def discover_solutions(root: Path = ROOT) -> List[Solution]:
+    solutions = []
+    for path in root.glob("test_day*/test_ex*.py"):
+        day = int(path.parent.name[len("test_day") :])
+        exercise = int(path.stem[len("test_ex") :])
+        solutions.append(Solution(day, 2 - exercise % 2, path))
+    return sorted(solutions)
+
+
+def select_solutions(
+    solutions: Iterable[Solution],
+    days: Optional[Sequence[int]] = None,
+    parts: Optional[Sequence[int]] = None,
+) -> List[Solution]:
+    return [
+        solution
+        for solution in solutions
+        if (not days or solution.day in days) and (not parts or solution.part in parts)
+    ]
+
+
+def run_solution(solution: Solution, cache: Optional[ResultCache] = None) -> Timing:
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    if cache is None:
+        output, cached = execute_solution(solution), False
+    else:
+        key = ResultCache.key(sources_digest(solution.path), _input_data(solution))
+        cached = key in cache
+        output = cache.get_or_compute(key, lambda: execute_solution(solution))
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    lines = output.strip().splitlines()
+    return Timing(
+        day=solution.day,
+        part=solution.part,
+        answer=lines[-1] if lines else "",
+        wall=wall,
+        cpu=cpu,
+        peak_rss=_peak_rss(),
+        cached=cached,
+    )
+
+
+def execute_solution(solution: Solution) -> str:
+    # Times, profiles and traces must be about the solver, not a cache hit of
+    # its __main__ block (--cache caches whole parts instead)
+    os.environ.pop(ENABLE_VARIABLE, None)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        runpy.run_path(str(solution.path), run_name="__main__")
+    return output.getvalue()
+
+
+def _input_data(solution: Solution) -> bytes:
+    path = solution.path.parent / "input.txt"
+    return path.read_bytes() if path.exists() else b""
+
+
+def load_estimates(path: Path) -> Estimates:
+    with open(path) as f:
+        # A cache hit took no time, it says nothing about how slow the part is
+        return {
+            (timing["day"], timing["part"]): timing["wall"]
+            for timing in json.load(f)
+            if not timing.get("cached", False)
+        }
+
+
+def schedule(solutions: Iterable[Solution], estimates: Estimates) -> List[Solution]:
+    # Longest processing time first. Parts never timed before could be the
+    # slowest ones, so they go first too
+    return sorted(
+        solutions,
+        key=lambda solution: estimates.get((solution.day, solution.part), math.inf),
+        reverse=True,
+    )
+
+
+def run_parallel(
+    solutions: Iterable[Solution],
+    jobs: Optional[int] = None,
+    estimates: Optional[Estimates] = None,
+    cache: Optional[ResultCache] = None,
+) -> Iterator[Timing]:
+    import multiprocessing
+
+    # ru_maxrss is the high-water mark of the whole process, so every part gets
+    # a fresh worker, otherwise it would report the biggest part run before it
+    with multiprocessing.Pool(jobs, maxtasksperchild=1) as pool:
+        yield from pool.imap_unordered(
+            functools.partial(run_solution, cache=cache),
+            schedule(solutions, estimates or {}),
+        )
+
+
+def _peak_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def format_row(timing: Timing) -> str:
+    return (
+        f"{timing.day:>3} {timing.part:>4}  {timing.answer:<20.20} "
+        f"{timing.wall:>9.3f} {timing.cpu:>9.3f} {timing.peak_rss / 1024:>9.1f}"
+        + ("  (cached)" if timing.cached else "")
+    )
+
+
+def format_total(timings: Iterable[Timing]) -> str:
+    timings = list(timings)
+    return (
+        f"{'':>8}  {'Total':<20} {sum(t.wall for t in timings):>9.3f} "
+        f"{sum(t.cpu for t in timings):>9.3f}"
+    )
+
+
+def format_table(timings: Iterable[Timing]) -> str:
+    timings = list(timings)
+    rows = [format_row(timing) for timing in timings]
+    return "\n".join([HEADER, *rows, format_total(timings)])
+
+
+def write_json(timings: Iterable[Timing], path: Path) -> None:
+    with open(path, "w") as f:
+        json.dump([asdict(timing) for timing in timings], f, indent=2)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc",
+        description="Run solutions and time them, every part in a fresh worker "
+        "process (so the peak memory is its own).",
+    )
+    parser.add_argument("-d", "--day", type=int, action="append", dest="days")
+    parser.add_argument(
+        "-p", "--part", type=int, action="append", dest="parts", choices=(1, 2)
+    )
+    parser.add_argument("--json", type=Path, help="write the timings to this file")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count(),
+        help="run the parts in a process pool (defaults to one worker per core)",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        help="timings from a previous run, used to start the slowest parts first "
+        "(defaults to the --json file when it exists)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse the answers of parts whose source and input did not change",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=Path("profiles"),
+        metavar="DIR",
+        help="profile the parts with cProfile instead of timing them, writing "
+        "the .pstats files to DIR (defaults to profiles/)",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help="with --profile, also run a sampling profiler and write the "
+        "collapsed stacks (.folded) for flamegraph tools",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace the parts with tracemalloc instead of timing them, showing "
+        "the peak memory and the lines that allocate the most",
+    )
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="show how long importing each part takes in a fresh interpreter, "
+        "and its heaviest imports",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    solutions = select_solutions(discover_solutions(), args.days, args.parts)
+    if args.profile:
+        from aoc.profiling import profile_solution
+
+        for solution in solutions:
+            print(profile_solution(solution, args.profile, sample=args.sample))
+        return
+    if args.memory:
+        from aoc.memory import format_usage, trace_solution
+
+        for solution in solutions:
+            print(format_usage(solution.name, trace_solution(solution)))
+        return
+    if args.imports:
+        from aoc.imports import (
+            format_imports,
+            heaviest_imports,
+            import_times,
+            solution_module,
+        )
+
+        for solution in solutions:
+            module = solution_module(solution)
+            imports = heaviest_imports(import_times(module), module)
+            print(format_imports(solution.name, imports))
+        return
+    cache = ResultCache() if args.cache else None
+    if args.jobs:
+        timings = _run_streaming(solutions, args.jobs, _history(args), cache)
+    else:
+        timings = sorted(
+            run_parallel(solutions, 1, cache=cache),
+            key=lambda timing: (timing.day, timing.part),
+        )
+        print(format_table(timings))
+    if args.json:
+        write_json(timings, args.json)
+
+
+def _history(args: argparse.Namespace) -> Estimates:
+    path = args.history or args.json
+    return load_estimates(path) if path and path.exists() else {}
+
+
+def _run_streaming(
+    solutions: List[Solution],
+    jobs: int,
+    estimates: Estimates,
+    cache: Optional[ResultCache],
+) -> List[Timing]:
+    print(HEADER)
+    start = time.perf_counter()
+    timings = []
+    for timing in run_parallel(solutions, jobs, estimates, cache):
+        print(format_row(timing), flush=True)
+        timings.append(timing)
+    print(format_total(timings))
+    print(f"{'':>8}  {'Elapsed':<20} {time.perf_counter() - start:>9.3f}")
+    return sorted(timings, key=lambda timing: (timing.day, timing.part))
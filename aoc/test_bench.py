@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.bench import (
+    BENCHMARKS,
+    Benchmark,
+    BenchmarkResult,
+    fit_exponent,
+    format_result,
+    load_baseline,
+    measure,
+    regression,
+    save_baseline,
+)
+
+
+def test_fit_exponent():
+    assert fit_exponent([10, 100, 1000], [1, 10, 100]) == pytest.approx(1)
+    assert fit_exponent([10, 20, 40], [1, 4, 16]) == pytest.approx(2)
+    assert fit_exponent([10, 20, 40], [3, 3, 3]) == pytest.approx(0)
+
+
+def test_measure():
+    result = measure(
+        Benchmark("sum", lambda size, seed: lambda: sum(range(size)), (10, 100))
+    )
+    assert result.name == "sum"
+    assert result.sizes == [10, 100]
+    assert all(t > 0 for t in result.times)
+
+
+def test_measure_memory():
+    result = measure(
+        Benchmark("list", lambda size, seed: lambda: list(range(size)), (10, 10000)),
+        memory=True,
+    )
+    assert len(result.peaks) == len(result.blocks) == 2
+    assert result.peaks[1] > result.peaks[0]
+    assert format_result(result).endswith(f"peak {result.peaks[1] / 1024:.0f} KiB")
+
+
+def test_regression():
+    baseline = BenchmarkResult("a", [1, 2], [1.0, 3.0])
+    assert regression(BenchmarkResult("a", [1, 2], [1.0, 4.0]), baseline) == 25
+    assert regression(BenchmarkResult("a", [1, 2], [0.5, 1.5]), baseline) == -50
+    with pytest.raises(ValueError, match="--bench-save"):
+        regression(BenchmarkResult("a", [1, 4], [9.0, 9.0]), baseline)
+
+
+def test_baseline_round_trip(tmp_path: Path):
+    assert load_baseline(tmp_path / "baseline.json") == {}
+    results = {"a": BenchmarkResult("a", [1, 2], [1.0, 3.0])}
+    save_baseline(results, tmp_path / "baseline.json")
+    assert load_baseline(tmp_path / "baseline.json") == results
+    results["b"] = BenchmarkResult("b", [1], [1.0], peaks=[2048], blocks=[3])
+    save_baseline(results, tmp_path / "baseline.json")
+    assert load_baseline(tmp_path / "baseline.json") == results
+
+
+@pytest.mark.parametrize("case", BENCHMARKS, ids=lambda case: case.name)
+def test_benchmark(case: Benchmark, request):
+    config = request.config
+    if not config.getoption("--bench"):
+        pytest.skip("Slow benchmark, run it with --bench 🙏")
+    memory = config.getoption("--bench-memory") or case.max_peak_per_item is not None
+    result = measure(case, memory=memory)
+    print(format_result(result))
+    if case.max_peak_per_item is not None:
+        per_item = result.peaks[-1] / result.sizes[-1]
+        assert (
+            per_item <= case.max_peak_per_item
+        ), f"{case.name} peaks at {per_item:.0f} bytes per item"
+
+    path = Path(config.getoption("--bench-baseline"))
+    baseline = load_baseline(path)
+    if config.getoption("--bench-save"):
+        baseline[case.name] = result
+        save_baseline(baseline, path)
+    elif case.name in baseline:
+        try:
+            slowdown = regression(result, baseline[case.name])
+        except ValueError as error:
+            pytest.fail(str(error))
+        assert slowdown <= config.getoption(
+            "--bench-max-regression"
+        ), f"{case.name} is {slowdown:.0f}% slower than the baseline"
@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+from aoc.cache import ResultCache, cached, local_sources
+from aoc.runner import Solution, run_solution, ROOT
+
+
+def test_key_changes_with_every_part():
+    key = ResultCache.key(b"source", b"input", (1, 2))
+    assert key == ResultCache.key(b"source", b"input", (1, 2))
+    assert key != ResultCache.key(b"edited source", b"input", (1, 2))
+    assert key != ResultCache.key(b"source", b"other input", (1, 2))
+    assert key != ResultCache.key(b"source", b"input", (1, 3))
+    # Parts are hashed separately, moving bytes between them is a different key
+    assert ResultCache.key(b"ab", b"c") != ResultCache.key(b"a", b"bc")
+
+
+def test_result_cache_round_trip(tmp_path):
+    cache = ResultCache(tmp_path)
+    assert "missing" not in cache
+    with pytest.raises(KeyError):
+        cache["missing"]
+    cache["key"] = {"answer": 42}
+    assert "key" in cache
+    assert cache["key"] == {"answer": 42}
+    assert cache.get_or_compute("key", lambda: 0) == {"answer": 42}
+    assert cache.get_or_compute("other", lambda: 7) == 7
+    assert cache["other"] == 7
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=2500)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache[key] = bytes(1000)
+        os.utime(tmp_path / f"{key}.pickle", (i, i))
+    assert "a" not in cache
+    cache["b"]  # touching it makes "c" the oldest one
+    cache["d"] = bytes(1000)
+    assert "b" in cache and "d" in cache and "c" not in cache
+    assert cache.size() <= 2500
+
+
+def test_cached(tmp_path):
+    calls = []
+
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    cached_square = cached(square, ResultCache(tmp_path))
+    assert cached_square(3) == 9
+    assert cached_square(3) == 9
+    assert cached_square(x=3) == 9
+    assert cached_square(4) == 16
+    assert calls == [3, 3, 4]
+
+
+def test_cached_is_opt_in_without_a_cache(monkeypatch):
+    def square(x: int) -> int:
+        return x * x
+
+    monkeypatch.delenv("AOC_CACHE", raising=False)
+    assert cached(square) is square
+    monkeypatch.setenv("AOC_CACHE", "0")
+    assert cached(square) is square
+    monkeypatch.setenv("AOC_CACHE", "1")
+    assert cached(square) is not square
+
+
+def test_run_solution_turns_the_main_cache_off(tmp_path, monkeypatch):
+    path = tmp_path / "solution.py"
+    path.write_text("import os\nprint(os.environ.get('AOC_CACHE'))")
+    monkeypatch.setenv("AOC_CACHE", "1")
+    assert run_solution(Solution(1, 1, path)).answer == "None"
+
+
+def test_local_sources():
+    sources = local_sources(ROOT / "test_day01" / "test_ex2.py")
+    assert [str(path.relative_to(ROOT)) for path in sources] == [
+        "aoc/__init__.py",
+        "aoc/inputs.py",
+        "test_day01/__init__.py",
+        "test_day01/test_ex1.py",
+        "test_day01/test_ex2.py",
+    ]
+
+
+def test_cached_recomputes_when_an_imported_helper_changes(tmp_path, monkeypatch):
+    import importlib
+
+    monkeypatch.setattr("aoc.cache.ROOT", tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "cache_helper.py").write_text("STEP = 1\n")
+    (tmp_path / "cache_solver.py").write_text(
+        "from cache_helper import STEP\n"
+        "\n"
+        "calls = []\n"
+        "\n"
+        "def solve(x):\n"
+        "    calls.append(x)\n"
+        "    return x + STEP\n"
+    )
+    solver = importlib.import_module("cache_solver")
+    solve = cached(solver.solve, ResultCache(tmp_path / "cache"))
+    assert solve(1) == 2
+    assert solve(1) == 2
+    assert solver.calls == [1]
+    (tmp_path / "cache_helper.py").write_text("STEP = 2\n")
+    solve(1)
+    assert solver.calls == [1, 1]
+
+
+def test_run_solution_cached(tmp_path):
+    solution = Solution(1, 1, ROOT / "test_day01" / "test_ex1.py")
+    cache = ResultCache(tmp_path)
+    first = run_solution(solution, cache)
+    second = run_solution(solution, cache)
+    assert (first.answer, first.cached) == ("651651", False)
+    assert (second.answer, second.cached) == ("651651", True)
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+from aoc.imports import (
+    ImportTime,
+    format_imports,
+    heaviest_imports,
+    import_times,
+    parse_importtime,
+    solution_module,
+)
+from aoc.runner import ROOT, discover_solutions, Solution
+
+STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | _io
+import time:       300 |        300 |     re._parser
+import time:       200 |        500 |   re
+import time:        50 |         50 |   typing
+import time:      1000 |       1550 | test_day07.test_ex13
+"""
+
+
+def test_parse_importtime():
+    times = parse_importtime(STDERR)
+    assert times[0] == ImportTime("_io", 0.0001, 0.0001, 0)
+    assert times[1] == ImportTime("re._parser", 0.0003, 0.0003, 2)
+    assert [time.depth for time in times] == [0, 2, 1, 1, 0]
+
+
+def test_heaviest_imports():
+    imports = heaviest_imports(parse_importtime(STDERR), "test_day07.test_ex13")
+    assert [time.module for time in imports] == ["test_day07.test_ex13", "re", "typing"]
+    assert format_imports("day07/part1", imports, top=1) == (
+        "day07/part1  import 1.6ms (test_day07.test_ex13)\n       0.5ms  re"
+    )
+
+
+def test_import_times():
+    times = import_times("test_day01.test_ex1")
+    assert times[-1].module == "test_day01.test_ex1"
+    assert times[-1].cumulative > 0
+
+
+def test_solution_module():
+    solution = Solution(7, 1, ROOT / "test_day07" / "test_ex13.py")
+    assert solution_module(solution) == "test_day07.test_ex13"
+
+
+def test_solutions_import_no_heavy_modules():
+    # numpy, regex and pytest are only imported when they are used
+    modules = ", ".join(solution_module(solution) for solution in discover_solutions())
+    heavy = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {modules}; "
+            "print(*sorted({'numpy', 'regex', 'pytest'} & set(sys.modules)))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert heavy.split() == []
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.inputs import (
+    input_path,
+    split_lines,
+    split_records,
+    chunk_records,
+    decode_record,
+    group_lines,
+    read_lines,
+    read_ints,
+    read_records,
+)
+
+
+@pytest.mark.parametrize(
+    "data, lines",
+    [
+        (b"", []),
+        (b"a", [b"a"]),
+        (b"a\nb\n", [b"a", b"b"]),
+        (b"a\n\nb", [b"a", b"", b"b"]),
+    ],
+)
+def test_split_lines(data, lines):
+    assert [line.tobytes() for line in split_lines(data)] == lines
+
+
+@pytest.mark.parametrize(
+    "data, records",
+    [
+        (b"", []),
+        (b"a\nb\n\nc", [b"a\nb", b"c"]),
+        (b"a\nb\n\nc\n", [b"a\nb", b"c"]),
+        (b"\na\n\n\n\nb\n\n", [b"a", b"b"]),
+    ],
+)
+def test_split_records(data, records):
+    assert [record.tobytes() for record in split_records(data)] == records
+
+
+def test_split_records_range():
+    data = b"a\n\nb\nc\n\nd\n"
+    assert [record.tobytes() for record in split_records(data, 3, 8)] == [b"b\nc"]
+
+
+def test_decode_record():
+    assert decode_record(memoryview(b"ecl:brn pid:760753108\nhgt:179cm")) == [
+        "ecl:brn pid:760753108",
+        "hgt:179cm",
+    ]
+
+
+def test_group_lines():
+    assert list(group_lines(["abc", "", "a", "b", "c", "", "", "ab", "ac", ""])) == [
+        ["abc"],
+        ["a", "b", "c"],
+        ["ab", "ac"],
+    ]
+    assert list(group_lines(iter([]))) == []
+
+
+@pytest.mark.parametrize("chunks", [1, 2, 3, 7, 50])
+def test_chunk_records(chunks):
+    data = b"\n\n".join(b"record %d\nline" % i for i in range(20)) + b"\n"
+    bounds = chunk_records(data, chunks)
+    assert len(bounds) <= chunks
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+    records = [
+        record.tobytes()
+        for start, end in bounds
+        for record in split_records(data, start, end)
+    ]
+    assert records == [record.tobytes() for record in split_records(data)]
+
+
+def test_chunk_records_are_balanced():
+    data = b"\n\n".join(b"x" * 10 for _ in range(1000))
+    sizes = [end - start for start, end in chunk_records(data, 4)]
+    assert len(sizes) == 4
+    assert max(sizes) - min(sizes) <= 2 * 12  # a record off on each side
+
+
+def test_chunk_records_empty():
+    assert chunk_records(b"", 4) == []
+
+
+def test_input_path():
+    assert input_path("/aoc/test_day01/test_ex1.py") == Path(
+        "/aoc/test_day01/input.txt"
+    )
+
+
+def test_read_lines(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1-3 a: abcde\n1-3 b: cdefg\n")
+    assert list(read_lines(path)) == ["1-3 a: abcde", "1-3 b: cdefg"]
+
+
+def test_read_ints(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1721\n979\n366")
+    assert list(read_ints(path)) == [1721, 979, 366]
+
+
+def test_read_records(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("abc\n\na\nb\nc\n\nab\nac\n")
+    assert list(read_records(path)) == [["abc"], ["a", "b", "c"], ["ab", "ac"]]
+
+
+def test_read_empty_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.touch()
+    assert list(read_lines(path)) == []
+    assert list(read_records(path)) == []
+
+
+def test_mapped_releases_the_map(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("a\nb\nc\n")
+    lines = read_lines(path)
+    assert next(lines) == "a"
+    data = lines.gi_frame.f_locals["data"]  # the map read_lines is reading
+    assert not data.closed
+    lines.close()  # stopping half way must not leave the map open
+    assert data.closed
@@ -0,0 +1,34 @@
+from aoc.memory import MemoryUsage, format_usage, trace_memory, trace_solution
+from aoc.runner import Solution, ROOT
+
+
+def _allocate():
+    kept = [bytearray(1024) for _ in range(100)]
+    freed = [bytearray(1024) for _ in range(1000)]
+    del freed
+    return kept
+
+
+def test_trace_memory():
+    kept, usage = trace_memory(_allocate, top=3)
+    assert len(kept) == 100
+    assert usage.peak >= 1100 * 1024
+    assert usage.blocks >= 100
+    line, size, count = usage.top[0]
+    assert line.startswith("test_memory.py:")
+    assert size >= 100 * 1024 and count >= 100
+
+
+def test_trace_solution():
+    usage = trace_solution(Solution(5, 2, ROOT / "test_day05" / "test_ex10.py"))
+    assert usage.peak > 0
+    # The seat ids list is still alive in the module globals
+    assert usage.top[0][0].startswith("test_ex10.py:")
+
+
+def test_format_usage():
+    usage = MemoryUsage(3 * 1024 * 1024, 42, [("test_ex28.py:34", 2048, 10)])
+    assert format_usage("day14/part2", usage) == (
+        "day14/part2  peak 3.0 MiB  42 blocks alive at the end\n"
+        "         2.0 KiB        10 blocks  test_ex28.py:34"
+    )
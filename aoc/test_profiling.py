@@ -0,0 +1,37 @@
+import pstats
+import time
+
+from aoc.profiling import SamplingProfiler, profile_solution
+from aoc.runner import Solution, ROOT
+
+
+def _busy(seconds: float) -> None:
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def test_sampling_profiler(tmp_path):
+    with SamplingProfiler(interval=0.001, root=__file__) as sampler:
+        _busy(0.1)
+    assert sum(sampler.stacks.values()) > 10
+    assert all(
+        stack.startswith("test_sampling_profiler (test_profiling.py:")
+        for stack in sampler.stacks
+    )
+    assert any("_busy (test_profiling.py:" in stack for stack in sampler.stacks)
+
+    sampler.write_collapsed(tmp_path / "busy.folded")
+    for line in (tmp_path / "busy.folded").read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert sampler.stacks[stack] == int(count)
+
+
+def test_profile_solution(tmp_path):
+    solution = Solution(1, 1, ROOT / "test_day01" / "test_ex1.py")
+    report = profile_solution(solution, tmp_path, top=5, sample=True)
+    assert report.startswith("day01/part1\n")
+    assert "Ordered by: internal time" in report
+    stats = pstats.Stats(str(tmp_path / "day01-part1.pstats"))
+    assert any(function == "expense_report" for _, _, function in stats.stats)
+    assert (tmp_path / "day01-part1.folded").exists()
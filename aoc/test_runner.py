@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+from aoc.runner import (
+    Solution,
+    Timing,
+    discover_solutions,
+    select_solutions,
+    run_solution,
+    run_parallel,
+    schedule,
+    load_estimates,
+    format_table,
+    write_json,
+    ROOT,
+)
+
+
+def test_discover_solutions():
+    solutions = discover_solutions()
+    assert len(solutions) == 40
+    assert solutions[0] == Solution(1, 1, ROOT / "test_day01" / "test_ex1.py")
+    assert solutions[9] == Solution(5, 2, ROOT / "test_day05" / "test_ex10.py")
+    assert solutions[-1] == Solution(20, 2, ROOT / "test_day20" / "test_ex40.py")
+
+
+def test_select_solutions():
+    solutions = discover_solutions()
+    assert [s.name for s in select_solutions(solutions, [3, 5], [2])] == [
+        "day03/part2",
+        "day05/part2",
+    ]
+    assert len(select_solutions(solutions)) == 40
+
+
+def test_run_solution():
+    timing = run_solution(Solution(1, 1, ROOT / "test_day01" / "test_ex1.py"))
+    assert timing.answer == "651651"
+    assert timing.wall > 0
+    assert timing.peak_rss > 0
+
+
+def test_run_solution_keeps_last_line():
+    timing = run_solution(Solution(3, 2, ROOT / "test_day03" / "test_ex6.py"))
+    assert timing.answer == "2106818610"
+
+
+def test_schedule_longest_first():
+    solutions = select_solutions(discover_solutions(), [1, 15, 17], [2])
+    estimates = {(1, 2): 0.05, (15, 2): 10.0}
+    assert [s.name for s in schedule(solutions, estimates)] == [
+        "day17/part2",
+        "day15/part2",
+        "day01/part2",
+    ]
+
+
+def test_run_parallel():
+    solutions = select_solutions(discover_solutions(), [1, 3], [1])
+    timings = list(run_parallel(solutions, 2))
+    assert sorted((t.day, t.answer) for t in timings) == [(1, "651651"), (3, "237")]
+
+
+def test_run_parallel_peak_rss_is_per_part(tmp_path: Path):
+    big, small = tmp_path / "big.py", tmp_path / "small.py"
+    big.write_text("print(len(bytearray(200 * 1024 * 1024)))")
+    small.write_text("print(1)")
+    solutions = [Solution(1, 1, big), Solution(1, 2, small)]
+    timings = sorted(run_parallel(solutions, 1), key=lambda timing: timing.part)
+    assert [timing.answer for timing in timings] == [str(200 * 1024 * 1024), "1"]
+    assert timings[0].peak_rss > 200 * 1024
+    assert timings[1].peak_rss < 100 * 1024
+
+
+def test_format_table():
+    table = format_table([Timing(1, 2, "42", 1.5, 1.25, 2048)])
+    header, row, total = table.splitlines()
+    assert header.split()[:3] == ["Day", "Part", "Answer"]
+    assert row.split() == ["1", "2", "42", "1.500", "1.250", "2.0"]
+    assert total.split() == ["Total", "1.500", "1.250"]
+
+
+def test_write_json(tmp_path: Path):
+    write_json([Timing(1, 2, "42", 1.5, 1.25, 2048)], tmp_path / "timings.json")
+    with open(tmp_path / "timings.json") as f:
+        assert json.load(f) == [
+            {
+                "day": 1,
+                "part": 2,
+                "answer": "42",
+                "wall": 1.5,
+                "cpu": 1.25,
+                "peak_rss": 2048,
+                "cached": False,
+            }
+        ]
+
+
+def test_load_estimates(tmp_path: Path):
+    write_json(
+        [Timing(1, 2, "42", 1.5, 1.25, 2048), Timing(3, 1, "7", 0.5, 0.5, 2048)],
+        tmp_path / "timings.json",
+    )
+    assert load_estimates(tmp_path / "timings.json") == {(1, 2): 1.5, (3, 1): 0.5}
+
+
+def test_load_estimates_skips_cache_hits(tmp_path: Path):
+    write_json(
+        [
+            Timing(1, 2, "42", 1.5, 1.25, 2048),
+            Timing(15, 2, "7", 0.01, 0.01, 2048, cached=True),
+        ],
+        tmp_path / "timings.json",
+    )
+    assert load_estimates(tmp_path / "timings.json") == {(1, 2): 1.5}
@@ -0,0 +1,10 @@
+from typing import Callable, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+def slow(test: F) -> F:
+    # Skipped unless pytest runs with --slow, without importing pytest in the
+    # solution modules (see conftest.py)
+    test.slow = True  # type: ignore
+    return test
@@ -0,0 +1,43 @@
+import pytest
+
+from aoc.bench import DEFAULT_BASELINE
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--slow", action="store_true", help="also run the tests marked as @slow"
+    )
+    group = parser.getgroup("bench", "solver benchmarks")
+    group.addoption(
+        "--bench", action="store_true", help="time the solvers over growing inputs"
+    )
+    group.addoption(
+        "--bench-save",
+        action="store_true",
+        help="store the benchmark results as the new baseline",
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=str(DEFAULT_BASELINE),
+        help="baseline file (default: %(default)s)",
+    )
+    group.addoption(
+        "--bench-max-regression",
+        type=float,
+        default=25.0,
+        help="fail when a solver is this percentage slower than the baseline",
+    )
+    group.addoption(
+        "--bench-memory",
+        action="store_true",
+        help="also trace the peak memory of every size with tracemalloc",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--slow"):
+        return
+    skip = pytest.mark.skip(reason="Slow test, run it with --slow 🙏")
+    for item in items:
+        if getattr(getattr(item, "function", None), "slow", False):
+            item.add_marker(skip)
@@ -1,14 +1,193 @@
-from pathlib import Path
-from typing import List
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 import itertools
+import math
+
+if TYPE_CHECKING:
+    import numpy as np  # type: ignore
+
+
+def k_sum(expenses: Sequence[int], k: int, target: int) -> Tuple[Tuple[int, ...], int]:
+    # Returns the k expenses (different positions) adding up to target, and
+    # their product
+    if k == 2:
+        found = _two_sum(expenses, target)
+    elif k == 3:
+        found = _three_sum(expenses, target)
+    else:
+        found = _meet_in_the_middle(expenses, k, target)
+    if found is None:
+        raise ValueError(f"No {k} expenses sum {target} D:")
+    return found, math.prod(found)
+
+
+def _two_sum(expenses: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    # O(n), the complement has to be seen before (so it is another expense)
+    seen = set()
+    for expense in expenses:
+        if target - expense in seen:
+            return (target - expense, expense)
+        seen.add(expense)
+    return None
+
+
+def _three_sum(expenses: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    # O(n²), sorted once, then two pointers closing in for every first expense
+    values = sorted(expenses)
+    for i, first in enumerate(values[:-2]):
+        if first + values[i + 1] + values[i + 2] > target:
+            break  # the smallest triple left is already too big
+        if i and first == values[i - 1]:
+            continue  # same first expense, same result
+        low, high = i + 1, len(values) - 1
+        while low < high:
+            total = first + values[low] + values[high]
+            if total == target:
+                return (first, values[low], values[high])
+            if total < target:
+                low += 1
+            else:
+                high -= 1
+    return None
+
+
+def _meet_in_the_middle(
+    expenses: Sequence[int], k: int, target: int
+) -> Optional[Tuple[int, ...]]:
+    # O(n^ceil(k/2)), sums of the first half of the combinations are indexed,
+    # the second half looks up its complement. Every index of the first half
+    # has to be lower than the second half ones, so they never overlap.
+    half = k // 2
+    indexes = range(len(expenses))
+    halves: Dict[int, List[Tuple[int, ...]]] = defaultdict(list)
+    for first in itertools.combinations(indexes, half):
+        halves[sum(expenses[i] for i in first)].append(first)
+    for second in itertools.combinations(indexes, k - half):
+        complement = target - sum(expenses[i] for i in second)
+        for first in halves.get(complement, ()):
+            if not first or first[-1] < second[0]:
+                return tuple(expenses[i] for i in first + second)
+    return None
+
+
+class ExpenseIndex:
+    # Many target sums over the same expenses. Built once: the sorted distinct
+    # values with their counts, and every sum of two of them with the lowest
+    # and highest smaller half it can be made of. Then a batch of pairs is a
+    # binary search per target, and a batch of triples one per (target, first
+    # expense), all of them in a few NumPy calls.
+    # The pair sums take O(distinct values²) memory, over MAX_PAIRS of them
+    # pairs are looked up in the sorted values, one search per (target,
+    # value), and triples fall back to _three_sum.
+    CHUNK = 1 << 22  # (target, value) cells per step, bounds the memory
+    MAX_PAIRS = 1 << 20
+
+    def __init__(self, expenses: Sequence[int]) -> None:
+        import numpy as np  # type: ignore
+
+        self._values, self._counts = np.unique(
+            np.asarray(expenses, dtype=np.int64), return_counts=True
+        )
+        self._sums: Optional["np.ndarray"] = None
+        if len(self._values) * (len(self._values) + 1) // 2 > self.MAX_PAIRS:
+            return
+        # Every pair of values (a value with itself only when it is there
+        # twice)
+        i, j = np.triu_indices(len(self._values))
+        keep = (i != j) | (self._counts[i] >= 2)
+        lows, highs = self._values[i[keep]], self._values[j[keep]]
+        order = np.lexsort((lows, lows + highs))
+        sums, lows = (lows + highs)[order], lows[order]
+        self._sums, first = np.unique(sums, return_index=True)
+        last = np.searchsorted(sums, self._sums, side="right") - 1
+        self._lowest, self._highest = lows[first], lows[last]
+
+    def query(self, targets: Sequence[int], k: int) -> List[Optional[Tuple[int, ...]]]:
+        import numpy as np
+
+        if k not in (2, 3):
+            raise ValueError(f"Only pairs and triples can be batched, not {k}")
+        if k == 3 and self._sums is None:
+            expenses = np.repeat(self._values, self._counts).tolist()
+            return [_three_sum(expenses, target) for target in targets]
+        sums = np.asarray(targets, dtype=np.int64)
+        found = np.zeros(len(sums), dtype=bool)
+        numbers = np.zeros((len(sums), k), dtype=np.int64)
+        if len(self._values):
+            if self._sums is None:
+                find = self._scan_pairs
+            else:
+                find = self._find_pairs if k == 2 else self._find_triples
+            step = max(1, self.CHUNK // len(self._values))
+            for start in range(0, len(sums), step):
+                chunk = slice(start, start + step)
+                found[chunk], numbers[chunk] = find(sums[chunk])
+        return [
+            tuple(row) if hit else None
+            for hit, row in zip(found.tolist(), numbers.tolist())
+        ]
+
+    def products(self, targets: Sequence[int], k: int) -> List[Optional[int]]:
+        return [
+            None if numbers is None else math.prod(numbers)
+            for numbers in self.query(targets, k)
+        ]
+
+    def _lookup(self, sums: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        import numpy as np
+
+        assert self._sums is not None
+        positions = np.searchsorted(self._sums, sums).clip(max=len(self._sums) - 1)
+        return self._sums[positions] == sums, positions
+
+    def _find_pairs(self, targets: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        import numpy as np
+
+        hit, positions = self._lookup(targets)
+        low = self._lowest[positions]
+        return hit, np.stack([low, targets - low], axis=1)
+
+    def _scan_pairs(self, targets: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        # a <= b for every (target, value a): b is the rest, when it is there
+        # (twice when it is a itself)
+        import numpy as np
+
+        values = self._values
+        needed = targets[:, None] - values[None, :]
+        positions = np.searchsorted(values, needed).clip(max=len(values) - 1)
+        hit = (values[positions] == needed) & (needed >= values)
+        hit &= (needed != values) | (self._counts >= 2)
+        first = hit.argmax(axis=1)
+        rows = np.arange(len(targets))
+        numbers = np.stack([values[first], needed[rows, first]], axis=1)
+        return np.any(hit, axis=1), numbers
+
+    def _find_triples(self, targets: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        # a <= b <= c: for every first value a (only up to target / 3) there
+        # is a pair b + c left when its highest b is still >= a. If b == a,
+        # a must be there as many times as the triple uses it.
+        import numpy as np
+
+        values = self._values[
+            : np.searchsorted(self._values, targets.max() // 3, side="right")
+        ]
+        if not len(values):
+            return np.zeros(len(targets), dtype=bool), np.zeros((len(targets), 3))
+        needed = targets[:, None] - values[None, :]
+        hit, positions = self._lookup(needed)
+        low = self._highest[positions]
+        high = needed - low
+        copies = 1 + (low == values) + (high == values)
+        hit &= (low >= values) & (self._counts[: len(values)] >= copies)
+        first = hit.argmax(axis=1)
+        rows = np.arange(len(targets))
+        numbers = np.stack([values[first], low[rows, first], high[rows, first]], axis=1)
+        return np.any(hit, axis=1), numbers
 
 
 def expense_report(expenses: List[int]) -> int:
     TARGET_SUM = 2020
-    for expense1, expense2 in itertools.combinations(expenses, 2):
-        if (expense1 + expense2) == TARGET_SUM:
-            return expense1 * expense2
-    raise Exception("Not found D:")
+    return k_sum(expenses, 2, TARGET_SUM)[1]
 
 
 def test_expense_report():
@@ -27,7 +206,94 @@ def test_expense_report():
     )
 
 
+def test_k_sum():
+    expenses = [1721, 979, 366, 299, 675, 1456]
+    assert k_sum(expenses, 2, 2020) == ((1721, 299), 514579)
+    assert k_sum(expenses, 3, 2020) == ((366, 675, 979), 241861950)
+
+
+def test_k_sum_finds_every_combination():
+    expenses = [1721, 979, 366, 299, 675, 1456, 979]
+    for k in range(1, 6):
+        for combination in itertools.combinations(expenses, k):
+            numbers, product = k_sum(expenses, k, sum(combination))
+            assert len(numbers) == k and sum(numbers) == sum(combination)
+            assert not Counter(numbers) - Counter(expenses)
+            assert product == math.prod(numbers)
+
+
+def test_k_sum_uses_every_expense_once():
+    import pytest
+
+    assert k_sum([1010, 5, 1010], 2, 2020) == ((1010, 1010), 1020100)
+    assert k_sum([1, 1, 1, 1], 4, 4) == ((1, 1, 1, 1), 1)
+    with pytest.raises(ValueError):
+        k_sum([1010, 5], 2, 2020)
+    with pytest.raises(ValueError):
+        k_sum([1000, 20, 1000], 3, 3000)
+    with pytest.raises(ValueError):
+        k_sum([1, 1, 1, 5], 4, 4)
+
+
+def test_expense_index():
+    index = ExpenseIndex([1721, 979, 366, 299, 675, 1456])
+    assert index.query([2020, 3442, 1], 2) == [(299, 1721), None, None]
+    assert index.query([2020, 979 * 3], 3) == [(366, 675, 979), None]
+    assert index.products([2020], 2) == [514579]
+    assert index.products([2020], 3) == [241861950]
+    assert ExpenseIndex([]).query([2020], 2) == [None]
+
+
+def test_expense_index_agrees_with_k_sum():
+    import random
+
+    rng = random.Random(2020)
+    expenses = [rng.randrange(1, 60) for _ in range(40)] + [7, 7, 7, 30, 30]
+    index = ExpenseIndex(expenses)
+    index.CHUNK = 100  # several steps per batch
+    targets = list(range(0, 200))
+    for k in (2, 3):
+        for target, numbers in zip(targets, index.query(targets, k)):
+            try:
+                expected = k_sum(expenses, k, target)[0]
+            except ValueError:
+                assert numbers is None
+                continue
+            assert numbers is not None and sum(numbers) == target
+            assert not Counter(numbers) - Counter(expenses)
+            assert sorted(numbers) == list(numbers) and len(expected) == k
+
+
+def test_expense_index_without_the_pair_sums():
+    import random
+
+    class SmallExpenseIndex(ExpenseIndex):
+        MAX_PAIRS = 10
+
+    rng = random.Random(12)
+    expenses = [rng.randrange(1, 60) for _ in range(40)] + [7, 7, 7, 30, 30]
+    targets = list(range(0, 200))
+    index, small = ExpenseIndex(expenses), SmallExpenseIndex(expenses)
+    small.CHUNK = 100
+    for k in (2, 3):
+        for numbers, expected in zip(small.query(targets, k), index.query(targets, k)):
+            assert (numbers is None) == (expected is None)
+            if numbers is not None and expected is not None:
+                assert sorted(numbers) == list(numbers)
+                assert sum(numbers) == sum(expected)
+                assert not Counter(numbers) - Counter(expenses)
+    assert SmallExpenseIndex([7, 7, 30, 30, 5]).query([14, 21, 60, 35, 10], 2) == [
+        (7, 7),
+        None,
+        (30, 30),
+        (5, 30),
+        None,
+    ]
+    assert SmallExpenseIndex([]).query([2020], 2) == [None]
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        expenses = [int(line) for line in f.readlines()]
+    from aoc.inputs import input_path, read_ints
+
+    expenses = list(read_ints(input_path(__file__)))
     print(expense_report(expenses))
@@ -1,14 +1,11 @@
-from pathlib import Path
 from typing import List
-import itertools
+
+from test_day01.test_ex1 import k_sum
 
 
 def expense_report_v2(expenses: List[int]) -> int:
     TARGET_SUM = 2020
-    for exp1, exp2, exp3 in itertools.combinations(expenses, 3):
-        if sum((exp1, exp2, exp3)) == TARGET_SUM:
-            return exp1 * exp2 * exp3
-    raise Exception("Not found D:")
+    return k_sum(expenses, 3, TARGET_SUM)[1]
 
 
 def test_expense_report_v2():
@@ -28,6 +25,7 @@ def test_expense_report_v2():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        expenses = [int(line) for line in f.readlines()]
+    from aoc.inputs import input_path, read_ints
+
+    expenses = list(read_ints(input_path(__file__)))
     print(expense_report_v2(expenses))
@@ -1,34 +1,112 @@
-from pathlib import Path
-from typing import List
+import re
+from typing import Iterable, List, TYPE_CHECKING
 from dataclasses import dataclass
-from collections import Counter
+
+if TYPE_CHECKING:
+    import numpy as np  # type: ignore
+
+# "1-3 a: abcde", one match per line of the whole file
+POLICY_LINE = re.compile(r"(\d+)-(\d+) (.): (.+)")
 
 
 # Ultra coupled :D
+# Slots instead of a __dict__, there is one of these per line
 @dataclass
 class PasswordPolicy:
+    __slots__ = ("letter", "minimum", "maximum", "password")
     letter: str
     minimum: int
     maximum: int
     password: str
 
     def is_valid(self) -> bool:
-        return self.minimum <= Counter(self.password)[self.letter] <= self.maximum
+        return self.minimum <= self.password.count(self.letter) <= self.maximum
 
     @staticmethod
     def from_text_line(line: str) -> "PasswordPolicy":
-        minmax, dirtyletter, password = line.split(" ")
-        letter = dirtyletter[0]
-        minimum, maximum = map(int, minmax.split("-"))
-        return PasswordPolicy(
-            letter=letter, minimum=minimum, maximum=maximum, password=password
-        )
+        return PasswordPolicy.from_text(line)[0]
+
+    @staticmethod
+    def from_text(text: str) -> List["PasswordPolicy"]:
+        return [
+            PasswordPolicy(letter, int(minimum), int(maximum), password)
+            for minimum, maximum, letter, password in POLICY_LINE.findall(text)
+        ]
 
 
-def valid_password_counter(passwords: List[PasswordPolicy]) -> int:
+def valid_password_counter(passwords: Iterable[PasswordPolicy]) -> int:
     return sum(1 for password in passwords if password.is_valid())
 
 
+@dataclass(frozen=True)
+class PasswordColumns:
+    # Every line of the file at once, one array per field. The passwords stay
+    # in the file buffer, each line has the [start, end) offsets of its own.
+    data: "np.ndarray"
+    first: "np.ndarray"  # minimum or first position, as written in the line
+    second: "np.ndarray"
+    letter: "np.ndarray"
+    start: "np.ndarray"
+    end: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @staticmethod
+    def from_bytes(text: bytes) -> "PasswordColumns":
+        # "1-3 a: abcde": passwords are letters, so there is exactly one "-"
+        # and one ":" per line, everything else is relative to them
+        import numpy as np  # type: ignore
+
+        data = np.frombuffer(text, dtype=np.uint8)
+        if len(data) and data[-1] != ord("\n"):
+            data = np.append(data, np.uint8(ord("\n")))
+        ends = np.flatnonzero(data == ord("\n"))
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        lines = ends > starts  # skip blank lines
+        starts, ends = starts[lines], ends[lines]
+        dashes = np.flatnonzero(data == ord("-"))
+        colons = np.flatnonzero(data == ord(":"))
+        return PasswordColumns(
+            data=data,
+            first=_parse_numbers(data, starts, dashes),
+            second=_parse_numbers(data, dashes + 1, colons - 2),
+            letter=data[colons - 1],
+            start=colons + 2,
+            end=ends,
+        )
+
+
+def _parse_numbers(
+    data: "np.ndarray", starts: "np.ndarray", ends: "np.ndarray"
+) -> "np.ndarray":
+    # One digit of every number per step, as many steps as the longest number
+    import numpy as np
+
+    numbers = np.zeros(len(starts), dtype=np.int64)
+    widths = ends - starts
+    for i in range(int(widths.max(initial=0))):
+        digits = i < widths
+        numbers[digits] = numbers[digits] * 10 + data[starts[digits] + i] - ord("0")
+    return numbers
+
+
+def columnar_valid_password_counter(columns: PasswordColumns) -> int:
+    import numpy as np
+
+    if not len(columns):
+        return 0
+    # Every byte from the start of a password to the start of the next one is
+    # compared with the letter of that password. The policy letter of the next
+    # line is in that range too, 3 bytes before its password ("c: ccc").
+    offset = columns.start[0]
+    lengths = np.diff(columns.start, append=len(columns.data))
+    matches = columns.data[offset:] == np.repeat(columns.letter, lengths)
+    matches[columns.start[1:] - 3 - offset] = False
+    counts = np.add.reduceat(matches, columns.start - offset, dtype=np.int64)
+    return int(np.count_nonzero((columns.first <= counts) & (counts <= columns.second)))
+
+
 def test_valid_password():
     assert (
         PasswordPolicy(letter="a", minimum=1, maximum=3, password="abcde").is_valid()
@@ -49,6 +127,17 @@ def test_transform_from_text_line():
     )
 
 
+def test_from_text():
+    assert PasswordPolicy.from_text("1-3 a: abcde\n\n1-3 b: cdefg\n") == [
+        PasswordPolicy(letter="a", minimum=1, maximum=3, password="abcde"),
+        PasswordPolicy(letter="b", minimum=1, maximum=3, password="cdefg"),
+    ]
+
+
+def test_password_policy_has_no_dict():
+    assert not hasattr(PasswordPolicy.from_text_line("1-3 a: abcde"), "__dict__")
+
+
 def test_valid_password_counter():
     passwords = [
         PasswordPolicy(letter="a", minimum=1, maximum=3, password="abcde"),
@@ -57,7 +146,36 @@ def test_valid_password_counter():
     assert valid_password_counter(passwords) == 1
 
 
+def test_password_columns():
+    columns = PasswordColumns.from_bytes(b"1-3 a: abcde\n1-3 b: cdefg\n\n2-19 c: cc")
+    assert columns.first.tolist() == [1, 1, 2]
+    assert columns.second.tolist() == [3, 3, 19]
+    assert bytes(columns.letter) == b"abc"
+    assert [
+        bytes(columns.data[start:end]) for start, end in zip(columns.start, columns.end)
+    ] == [b"abcde", b"cdefg", b"cc"]
+
+
+def test_columnar_valid_password_counter():
+    columns = PasswordColumns.from_bytes(
+        b"1-3 a: abcde\n\n1-3 b: cdefg\n2-9 c: ccccccccc\n"
+    )
+    assert columnar_valid_password_counter(columns) == 2
+    assert columnar_valid_password_counter(PasswordColumns.from_bytes(b"")) == 0
+
+
+def test_columnar_agrees_with_password_policies():
+    from aoc.generators import generate
+
+    text = generate(2, 1000, seed=2)
+    passwords = [PasswordPolicy.from_text_line(line) for line in text.splitlines()]
+    assert columnar_valid_password_counter(
+        PasswordColumns.from_bytes(text.encode())
+    ) == valid_password_counter(passwords)
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        passwords = [PasswordPolicy.from_text_line(line) for line in f.readlines()]
-    print(valid_password_counter(passwords))
+    from aoc.inputs import input_path
+
+    columns = PasswordColumns.from_bytes(input_path(__file__).read_bytes())
+    print(columnar_valid_password_counter(columns))
@@ -1,11 +1,13 @@
-from pathlib import Path
-from typing import List
+from typing import Iterable, List
 from dataclasses import dataclass
 
+from test_day02.test_ex3 import POLICY_LINE, PasswordColumns
+
 
 # Ultra coupled :D
 @dataclass
 class PasswordPolicy:
+    __slots__ = ("letter", "first_index", "second_index", "password")
     letter: str
     first_index: int
     second_index: int
@@ -18,21 +20,32 @@ class PasswordPolicy:
 
     @staticmethod
     def from_text_line(line: str) -> "PasswordPolicy":
-        indexes, dirtyletter, password = line.split(" ")
-        letter = dirtyletter[0]
-        first_index, second_index = map(lambda s: int(s) - 1, indexes.split("-"))
-        return PasswordPolicy(
-            letter=letter,
-            first_index=first_index,
-            second_index=second_index,
-            password=password,
-        )
+        return PasswordPolicy.from_text(line)[0]
 
+    @staticmethod
+    def from_text(text: str) -> List["PasswordPolicy"]:
+        return [
+            PasswordPolicy(letter, int(first) - 1, int(second) - 1, password)
+            for first, second, letter, password in POLICY_LINE.findall(text)
+        ]
 
-def valid_password_counter(passwords: List[PasswordPolicy]) -> int:
+
+def valid_password_counter(passwords: Iterable[PasswordPolicy]) -> int:
     return sum(1 for password in passwords if password.is_valid())
 
 
+def columnar_valid_password_counter(columns: PasswordColumns) -> int:
+    import numpy as np  # type: ignore
+
+    def letter_at(positions: "np.ndarray") -> "np.ndarray":
+        # Positions start at 1, and past the end of the password never match
+        offsets = columns.start + positions - 1
+        inside = offsets < columns.end
+        return inside & (columns.data[np.where(inside, offsets, 0)] == columns.letter)
+
+    return int(np.count_nonzero(letter_at(columns.first) ^ letter_at(columns.second)))
+
+
 def test_valid_password():
     assert (
         PasswordPolicy(
@@ -66,6 +79,13 @@ def test_transform_from_text_line():
     )
 
 
+def test_from_text():
+    assert PasswordPolicy.from_text("1-3 a: abcde\n2-9 c: ccccccccc") == [
+        PasswordPolicy(letter="a", first_index=0, second_index=2, password="abcde"),
+        PasswordPolicy(letter="c", first_index=1, second_index=8, password="ccccccccc"),
+    ]
+
+
 def test_valid_password_counter():
     passwords = [
         PasswordPolicy(letter="a", first_index=0, second_index=2, password="abcde"),
@@ -74,7 +94,25 @@ def test_valid_password_counter():
     assert valid_password_counter(passwords) == 1
 
 
+def test_columnar_valid_password_counter():
+    columns = PasswordColumns.from_bytes(
+        b"1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n1-9 d: dd\n"
+    )
+    assert columnar_valid_password_counter(columns) == 2
+
+
+def test_columnar_agrees_with_password_policies():
+    from aoc.generators import generate
+
+    text = generate(2, 1000, seed=4)
+    passwords = [PasswordPolicy.from_text_line(line) for line in text.splitlines()]
+    assert columnar_valid_password_counter(
+        PasswordColumns.from_bytes(text.encode())
+    ) == valid_password_counter(passwords)
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        passwords = [PasswordPolicy.from_text_line(line) for line in f.readlines()]
-    print(valid_password_counter(passwords))
+    from aoc.inputs import input_path
+
+    columns = PasswordColumns.from_bytes(input_path(__file__).read_bytes())
+    print(columnar_valid_password_counter(columns))
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List, Any
 from collections import UserList
 from itertools import count
@@ -52,6 +51,7 @@ def test_treemap_slope_tree_count():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        treemap = [TreeRow(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_lines
+
+    treemap = [TreeRow(line) for line in read_lines(input_path(__file__))]
     print(slope_tree_count(treemap))
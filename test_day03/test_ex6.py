@@ -1,20 +1,105 @@
+import contextlib
 from pathlib import Path
-from typing import List, Any
-from collections import UserList
-from itertools import count
+from typing import Iterator, List, Sequence, Tuple, Union
 
+from aoc.inputs import Buffer, mapped
 
-class TreeRow(UserList):
-    def __getitem__(self, key: Any) -> Any:
-        return self.data[key % len(self.data)]
+TREE = ord("#")
 
+TREE_BITS = str.maketrans("#.", "10")
 
-TreeMap = List[TreeRow]
 
+class TreeRow:
+    # The whole row in one int, bit i is set when there is a tree in column i
+    __slots__ = ("trees", "width")
+
+    def __init__(self, line: str) -> None:
+        self.width = len(line)
+        self.trees = int(line[::-1].translate(TREE_BITS) or "0", 2)
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __getitem__(self, key: int) -> str:
+        return "#" if self.trees >> (key % self.width) & 1 else "."
+
+
+TreeMap = List[TreeRow]
 
-def slope_tree_count(treemap: TreeMap, right: int, down: int) -> int:
-    col = count(right, right)
-    return sum(1 for treerow in treemap[down::down] if treerow[next(col)] == "#")
+Slope = Tuple[int, int]  # (right, down)
+
+
+class MappedTreeMap:
+    # The map file used in place, no row objects. Rows all have the same
+    # width, so (row, col) is at row * stride + col % width.
+    CHUNK = 1 << 20  # rows per step when counting with NumPy
+
+    def __init__(self, data: Buffer) -> None:
+        self.data = data
+        newline = data.find(b"\n")
+        self.width = len(data) if newline == -1 else newline
+        self.stride = self.width + 1
+        self.rows = (len(data) + 1) // self.stride if self.width else 0
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open(path: Path) -> Iterator["MappedTreeMap"]:
+        with mapped(path) as data:
+            yield MappedTreeMap(data)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def has_tree(self, row: int, col: int) -> bool:
+        return self.data[row * self.stride + col % self.width] == TREE
+
+    def tree_count(self, right: int, down: int) -> int:
+        # The offsets of a chunk of rows at a time, the memory does not grow
+        # with the map
+        import numpy as np  # type: ignore
+
+        data = np.frombuffer(self.data, dtype=np.uint8)
+        count = 0
+        for start in range(down, self.rows, down * self.CHUNK):
+            rows = np.arange(start, min(start + down * self.CHUNK, self.rows), down)
+            offsets = rows * self.stride + rows // down * right % self.width
+            count += int(np.count_nonzero(data[offsets] == TREE))
+        return count
+
+
+def slope_tree_count(
+    treemap: Union[TreeMap, MappedTreeMap], right: int, down: int
+) -> int:
+    if isinstance(treemap, MappedTreeMap):
+        return sum(
+            treemap.has_tree(row, step * right)
+            for step, row in enumerate(range(down, len(treemap), down), 1)
+        )
+    return sum(
+        row.trees >> (step * right % row.width) & 1
+        for step, row in enumerate(treemap[down::down], 1)
+    )
+
+
+def multi_slope_tree_count(
+    treemap: Union[TreeMap, MappedTreeMap], slopes: Sequence[Slope]
+) -> List[int]:
+    # One pass packs the rows into a uint64 array, then every slope is a few
+    # vectorized operations over the rows it goes through
+    import numpy as np  # type: ignore
+
+    if isinstance(treemap, MappedTreeMap):
+        return [treemap.tree_count(right, down) for right, down in slopes]
+    if treemap and treemap[0].width > 64:
+        return [slope_tree_count(treemap, right, down) for right, down in slopes]
+    trees = np.fromiter((row.trees for row in treemap), np.uint64, len(treemap))
+    width = treemap[0].width if treemap else 1
+    counts = []
+    for right, down in slopes:
+        rows = trees[down::down]
+        cols = np.arange(1, len(rows) + 1, dtype=np.uint64) * right % width
+        counts.append(int(np.count_nonzero(rows >> cols & 1)))
+    return counts
 
 
 def test_treerow_existing_positions():
@@ -53,16 +138,61 @@ def test_treemap_slope_tree_count():
     assert slope_tree_count(treemap, 5, 1) == 3
     assert slope_tree_count(treemap, 7, 1) == 4
     assert slope_tree_count(treemap, 1, 2) == 2
+    assert multi_slope_tree_count(
+        treemap, [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+    ) == [2, 7, 3, 4, 2]
+    assert multi_slope_tree_count(treemap, []) == []
+
+
+def test_multi_slope_tree_count_agrees_with_slope_tree_count():
+    from aoc.generators import generate
+
+    treemap = [TreeRow(line) for line in generate(3, 1000, seed=6).splitlines()]
+    slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2), (2, 3), (40, 7)]
+    assert multi_slope_tree_count(treemap, slopes) == [
+        sum(
+            1
+            for step, row in enumerate(treemap[down::down], 1)
+            if row[step * right] == "#"
+        )
+        for right, down in slopes
+    ]
+
+
+def test_mapped_tree_map(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("..##.\n#...#\n.#..#")  # no newline at the end
+    with MappedTreeMap.open(path) as treemap:
+        assert (len(treemap), treemap.width) == (3, 5)
+        assert treemap.has_tree(0, 2) and treemap.has_tree(1, 9)
+        assert not treemap.has_tree(2, 0)
+
+
+def test_mapped_tree_map_agrees_with_tree_rows(tmp_path):
+    from aoc.generators import generate
+
+    text = generate(3, 1000, seed=16)
+    path = tmp_path / "input.txt"
+    path.write_text(text + "\n")
+    treemap = [TreeRow(line) for line in text.splitlines()]
+    slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2), (2, 3), (40, 7)]
+    with MappedTreeMap.open(path) as mapped_treemap:
+        mapped_treemap.CHUNK = 10  # several steps per slope
+        assert multi_slope_tree_count(mapped_treemap, slopes) == [
+            slope_tree_count(mapped_treemap, right, down) for right, down in slopes
+        ]
+        assert multi_slope_tree_count(mapped_treemap, slopes) == multi_slope_tree_count(
+            treemap, slopes
+        )
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        treemap = [TreeRow(line.rstrip("\n")) for line in f]
-    a = slope_tree_count(treemap, 1, 1)
-    b = slope_tree_count(treemap, 3, 1)
-    c = slope_tree_count(treemap, 5, 1)
-    d = slope_tree_count(treemap, 7, 1)
-    e = slope_tree_count(treemap, 1, 2)
+    from aoc.inputs import input_path
+
+    with MappedTreeMap.open(input_path(__file__)) as treemap:
+        a, b, c, d, e = multi_slope_tree_count(
+            treemap, [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+        )
 
     print(a, b, c, d, e)
     print(a * b * c * d * e)
@@ -1,6 +1,4 @@
-from pathlib import Path
-from typing import Dict, List, Iterable, Generator
-from itertools import takewhile
+from typing import Dict, Iterable
 
 
 Passport = Dict[str, str]
@@ -11,12 +9,6 @@ def build_passport_from_lines(lines: Iterable[str]) -> Passport:
     return dict([(keyvalue.split(":")) for keyvalue in keyvalues])  # type: ignore
 
 
-def separate_passport_lines(raw_lines: List[str]) -> Generator[List[str], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while (lines := list(takewhile(lambda line: line != "", raw_lines_iterator))) :
-        yield lines
-
-
 def count_valid_passports(passports: Iterable[Passport]) -> int:
     return sum(1 for passport in passports if is_valid_passport(passport))
 
@@ -107,36 +99,12 @@ def test_build_passport_from_lines():
     }
 
 
-def test_separate_passport_lines():
-    assert list(
-        separate_passport_lines(
-            [
-                "hcl:#ae17e1 iyr:2013",
-                "eyr:2024",
-                "",
-                "ecl:brn pid:760753108 byr:1931",
-                "hgt:179cm",
-            ]
-        )
-    ) == [
-        [
-            "hcl:#ae17e1 iyr:2013",
-            "eyr:2024",
-        ],
-        [
-            "ecl:brn pid:760753108 byr:1931",
-            "hgt:179cm",
-        ],
-    ]
-
-
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_passports = [line.rstrip("\n") for line in f]
+    from aoc.inputs import input_path, read_records
 
     passports = (
         build_passport_from_lines(raw_passport)
-        for raw_passport in separate_passport_lines(raw_passports)
+        for raw_passport in read_records(input_path(__file__))
     )
 
     print(count_valid_passports(passports))
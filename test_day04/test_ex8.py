@@ -1,27 +1,84 @@
 from pathlib import Path
-from typing import Dict, List, Iterable
-from itertools import takewhile
+from typing import Callable, Dict, Iterable, Optional, Union
 import re
 
+from aoc.inputs import chunk_records, group_lines, mapped, split_records
+
 
 Passport = Dict[str, str]
 
+Record = Union[bytes, memoryview]  # raw passport, "key:value" separated by spaces
+
+# Every rule as a single pattern over the raw value, ranges included
+FIELD_PATTERNS = {
+    "byr": r"19[2-9][0-9]|200[0-2]",
+    "iyr": r"201[0-9]|2020",
+    "eyr": r"202[0-9]|2030",
+    "hgt": r"(?:1[5-8][0-9]|19[0-3])cm|(?:59|6[0-9]|7[0-6])in",
+    "hcl": r"#[a-fA-F0-9]{6}",
+    "ecl": r"amb|blu|brn|gry|grn|hzl|oth",
+    "pid": r"[0-9]{9}",
+}
+
 
 def build_passport_from_lines(lines: Iterable[str]) -> Passport:
     keyvalues = " ".join(lines).split(" ")
     return dict(((keyvalue.split(":")) for keyvalue in keyvalues))  # type: ignore
 
 
-def separate_passport_lines(raw_lines: List[str]) -> Iterable[List[str]]:
-    raw_lines_iterator = iter(raw_lines)
-    while (lines := list(takewhile(lambda line: line != "", raw_lines_iterator))) :
-        yield lines
-
-
 def count_valid_passports(passports: Iterable[Passport]) -> int:
     return sum(1 for passport in passports if is_valid_passport(passport))
 
 
+def compile_validator(patterns: Dict[str, str]) -> Callable[[Record], bool]:
+    # One alternation of every field with its rule, so a single findall over
+    # the raw record finds all the valid fields, no dict at all. Then it is
+    # valid when every field showed up.
+    regex = re.compile(
+        "(?<!\\S)({})(?!\\S)".format(
+            "|".join(f"{name}:(?:{pattern})" for name, pattern in patterns.items())
+        ).encode()
+    )
+    names = {name.encode() for name in patterns}
+
+    def is_valid(record: Record) -> bool:
+        return {field.split(b":", 1)[0] for field in regex.findall(record)} == names
+
+    return is_valid
+
+
+is_valid_record = compile_validator(FIELD_PATTERNS)
+
+
+def count_valid_records(records: Iterable[Record]) -> int:
+    return sum(map(is_valid_record, records))
+
+
+def count_valid_passport_file(path: Path, jobs: Optional[int] = 1) -> int:
+    # The file is cut in byte ranges that only end between records, every
+    # worker maps it again and counts its own ranges. jobs=None is one worker
+    # per core.
+    if jobs == 1:
+        return _count_valid_range(path, 0, None)
+    from concurrent.futures import ProcessPoolExecutor
+    import os
+
+    workers = jobs or os.cpu_count() or 1
+    with mapped(path) as data:
+        ranges = chunk_records(data, workers * 4)  # a few per worker, they vary
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(_count_valid_range, path, start, end)
+            for start, end in ranges
+        ]
+        return sum(future.result() for future in futures)
+
+
+def _count_valid_range(path: Path, start: int, end: Optional[int]) -> int:
+    with mapped(path) as data:
+        return count_valid_records(split_records(data, start, end))
+
+
 def is_valid_passport(passport: Passport) -> bool:
     return (
         _has_all_mandatory_fields(passport)
@@ -199,36 +256,51 @@ def test_build_passport_from_lines():
     }
 
 
-def test_separate_passport_lines():
-    assert list(
-        separate_passport_lines(
-            [
-                "hcl:#ae17e1 iyr:2013",
-                "eyr:2024",
-                "",
-                "ecl:brn pid:760753108 byr:1931",
-                "hgt:179cm",
-            ]
-        )
-    ) == [
-        [
-            "hcl:#ae17e1 iyr:2013",
-            "eyr:2024",
-        ],
-        [
-            "ecl:brn pid:760753108 byr:1931",
-            "hgt:179cm",
-        ],
+def test_compile_validator():
+    is_valid = compile_validator({"a": r"[0-9]{2}", "b": r"x|y"})
+    assert is_valid(b"a:12 b:x") is True
+    assert is_valid(b"b:y\nc:1 a:99") is True
+    assert is_valid(b"a:123 b:x") is False
+    assert is_valid(b"a:12 b:z") is False
+    assert is_valid(b"a:12 cb:x") is False
+    assert is_valid(b"a:12") is False
+
+
+def test_is_valid_record():
+    assert is_valid_record(
+        b"pid:087499704 hgt:74in ecl:grn iyr:2012 eyr:2030 byr:1980\nhcl:#623a2f"
+    )
+    assert not is_valid_record(
+        b"eyr:1972 cid:100\nhcl:#18171d ecl:amb hgt:170 pid:186cm iyr:2018 byr:1926"
+    )
+    assert not is_valid_record(
+        b"pid:087499704 hgt:190in ecl:grn iyr:2012 eyr:2030 byr:1980 hcl:#623a2f"
+    )
+
+
+def test_count_valid_records_agrees_with_passports():
+    from aoc.generators import generate
+
+    text = generate(4, 2000, seed=17)
+    passports = [
+        build_passport_from_lines(lines) for lines in group_lines(text.splitlines())
     ]
+    records = [record.encode() for record in text.split("\n\n")]
+    assert count_valid_records(records) == count_valid_passports(passports)
 
 
-if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_passports = [line.rstrip("\n") for line in f]
+def test_count_valid_passport_file(tmp_path):
+    from aoc.generators import generate
 
-    passports = (
-        build_passport_from_lines(raw_passport)
-        for raw_passport in separate_passport_lines(raw_passports)
-    )
+    text = generate(4, 500, seed=18)
+    path = tmp_path / "input.txt"
+    path.write_text(text + "\n")
+    expected = count_valid_records(record.encode() for record in text.split("\n\n"))
+    assert count_valid_passport_file(path) == expected
+    assert count_valid_passport_file(path, jobs=3) == expected
+
+
+if __name__ == "__main__":
+    from aoc.inputs import input_path
 
-    print(count_valid_passports(passports))
+    print(count_valid_passport_file(input_path(__file__)))
@@ -1,4 +1,6 @@
-from pathlib import Path
+from typing import Sequence
+
+from test_day05.test_ex9 import decode_seat_ids
 
 
 def letters_to_position(letters: str) -> int:
@@ -12,6 +14,15 @@ def get_seat_id(letters: str) -> int:
     return row * 8 + col
 
 
+def find_missing_seat(seat_ids: Sequence[int]) -> int:
+    # The ids are every seat from the lowest to the highest but one, so it is
+    # whatever the sum of that range is missing, no lookups at all
+    if not seat_ids or max(seat_ids) - min(seat_ids) != len(seat_ids):
+        raise ValueError("The seats are not a full flight but one")
+    expected = (min(seat_ids) + max(seat_ids)) * (len(seat_ids) + 1) // 2
+    return expected - sum(seat_ids)
+
+
 def test_letters_to_position():
     assert letters_to_position("BBFFBBF") == 102
     assert letters_to_position("RLL") == 4
@@ -22,9 +33,29 @@ def test_get_seat_id():
     assert get_seat_id("FFFBBBFRRR") == 119
 
 
+def test_find_missing_seat():
+    import pytest
+
+    assert find_missing_seat([3, 5, 7, 4]) == 6
+    assert find_missing_seat([8, 10]) == 9
+    with pytest.raises(ValueError):
+        find_missing_seat([3, 4, 5])
+    with pytest.raises(ValueError):
+        find_missing_seat([3, 7, 8])
+    with pytest.raises(ValueError):
+        find_missing_seat([])
+
+
+def test_find_missing_seat_in_a_generated_flight():
+    from aoc.generators import generate
+
+    seat_ids = decode_seat_ids(generate(5, 5000, seed=19).encode())
+    missing = find_missing_seat(seat_ids)
+    assert missing not in seat_ids
+    assert {missing - 1, missing + 1} <= set(seat_ids)
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        seat_ids = [get_seat_id(line.rstrip("\n")) for line in f]
-    max_id = max(seat_ids)
-    missing_ids = [seat_id for seat_id in range(max_id) if seat_id not in seat_ids]
-    print(missing_ids)  # manually see the different seat, it's easy :P
+    from aoc.inputs import input_path
+
+    print(find_missing_seat(decode_seat_ids(input_path(__file__).read_bytes())))
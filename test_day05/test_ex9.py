@@ -1,4 +1,7 @@
-from pathlib import Path
+from typing import List
+
+# The whole boarding pass is the seat id in binary, row bits then column bits
+SEAT_BITS = bytes.maketrans(b"BRFL", b"1100")
 
 
 def letters_to_position(letters: str) -> int:
@@ -12,6 +15,11 @@ def get_seat_id(letters: str) -> int:
     return row * 8 + col
 
 
+def decode_seat_ids(data: bytes) -> List[int]:
+    # One translate for the whole file, then every line is a base 2 int
+    return [int(code, 2) for code in data.translate(SEAT_BITS).split()]
+
+
 def test_letters_to_position():
     assert letters_to_position("BBFFBBF") == 102
     assert letters_to_position("RLL") == 4
@@ -22,7 +30,13 @@ def test_get_seat_id():
     assert get_seat_id("FFFBBBFRRR") == 119
 
 
+def test_decode_seat_ids():
+    assert decode_seat_ids(b"BFFFBBFRRR\nFFFBBBFRRR\n") == [567, 119]
+    assert decode_seat_ids(b"BBFFBBFRLL") == [get_seat_id("BBFFBBFRLL")]
+    assert decode_seat_ids(b"") == []
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        seat_ids = [get_seat_id(line.rstrip("\n")) for line in f]
-    print(max(seat_ids))
+    from aoc.inputs import input_path
+
+    print(max(decode_seat_ids(input_path(__file__).read_bytes())))
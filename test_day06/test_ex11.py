@@ -1,37 +1,89 @@
+import functools
+import operator
 from pathlib import Path
-from typing import List, Iterable, Generator
-from itertools import takewhile
+from typing import Iterable, Iterator, Tuple, Union
 
+from aoc.inputs import Buffer, mapped, split_records
 
-def separate_group_lines(raw_lines: List[str]) -> Generator[List[str], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while (lines := list(takewhile(lambda line: line != "", raw_lines_iterator))) :
-        yield lines
+# Answers as a 26 bit int, bit i is the i-th letter of the alphabet
+Answers = int
+
+ALL_ANSWERS = (1 << 26) - 1
+
+
+def answers_to_mask(answers: Union[bytes, memoryview]) -> Answers:
+    mask = 0
+    for letter in answers:
+        mask |= 1 << (letter - ord("a"))
+    return mask
+
+
+def popcount(mask: Answers) -> int:
+    return bin(mask).count("1")
 
 
 def count_affimative_answers_from_lines(lines: Iterable[str]) -> int:
-    return len(set("".join(lines)))
+    masks = (answers_to_mask(line.encode()) for line in lines)
+    return popcount(functools.reduce(operator.or_, masks, 0))
 
 
-def test_separate_group_lines():
-    assert list(separate_group_lines(["abc", "", "a", "b", "c", "", "ab", "ac"])) == [
-        ["abc"],
-        ["a", "b", "c"],
-        ["ab", "ac"],
-    ]
+def read_group_answers(path: Path) -> Iterator[Tuple[Answers, Answers]]:
+    with mapped(path) as data:
+        yield from group_answers(data)
+
+
+def group_answers(data: Buffer) -> Iterator[Tuple[Answers, Answers]]:
+    # (anyone, everyone) answers of every group, one group at a time, so the
+    # memory does not grow with the groups
+    for record in split_records(data):
+        anyone, everyone = 0, ALL_ANSWERS
+        for person in record.tobytes().split(b"\n"):
+            mask = answers_to_mask(person)
+            anyone, everyone = anyone | mask, everyone & mask
+        yield anyone, everyone
+
+
+def count_answers(groups: Iterable[Tuple[Answers, Answers]]) -> Tuple[int, int]:
+    # Both parts in the same pass: answered by anyone, answered by everyone
+    total_anyone = total_everyone = 0
+    for anyone, everyone in groups:
+        total_anyone += popcount(anyone)
+        total_everyone += popcount(everyone)
+    return total_anyone, total_everyone
 
 
 def test_count_affimative_answers_from_lines():
     assert count_affimative_answers_from_lines(["ab", "ac"]) == 3
 
 
-if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-
-    print(
-        sum(
-            count_affimative_answers_from_lines(lines)
-            for lines in separate_group_lines(raw_lines)
-        )
+def test_answers_to_mask():
+    assert answers_to_mask(b"") == 0
+    assert answers_to_mask(b"ac") == 0b101
+    assert answers_to_mask(b"zaa") == 1 << 25 | 1
+
+
+def test_read_group_answers(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("abc\n\na\nb\nc\n\n\nab\nac\n\nb\n")
+    groups = list(read_group_answers(path))
+    assert groups == [(0b111, 0b111), (0b111, 0), (0b111, 0b1), (0b10, 0b10)]
+    assert count_answers(groups) == (10, 5)
+
+
+def test_count_answers_agrees_with_sets(tmp_path):
+    from aoc.generators import generate
+
+    text = generate(6, 500, seed=20)
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    groups = [group.split("\n") for group in text.split("\n\n")]
+    assert count_answers(read_group_answers(path)) == (
+        sum(len(set("".join(group))) for group in groups),
+        sum(len(set.intersection(*map(set, group))) for group in groups),
     )
+
+
+if __name__ == "__main__":
+    from aoc.inputs import input_path
+
+    print(count_answers(read_group_answers(input_path(__file__)))[0])
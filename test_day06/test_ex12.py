@@ -1,39 +1,31 @@
-from pathlib import Path
-from typing import List, Generator
-from itertools import takewhile
+import functools
+import operator
+from typing import List
 
-
-def separate_group_lines(raw_lines: List[str]) -> Generator[List[str], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while (lines := list(takewhile(lambda line: line != "", raw_lines_iterator))) :
-        yield lines
+from test_day06.test_ex11 import (
+    ALL_ANSWERS,
+    answers_to_mask,
+    count_answers,
+    popcount,
+    read_group_answers,
+)
 
 
 def count_all_affirmative_answers_from_group(group_lines: List[str]) -> int:
-    return len(set(group_lines[0]).intersection(*(set(group) for group in group_lines)))
-
-
-def test_separate_group_lines():
-    assert list(separate_group_lines(["abc", "", "a", "b", "c", "", "ab", "ac"])) == [
-        ["abc"],
-        ["a", "b", "c"],
-        ["ab", "ac"],
-    ]
+    if not group_lines:
+        return 0  # nobody, not everyone answering everything
+    masks = (answers_to_mask(line.encode()) for line in group_lines)
+    return popcount(functools.reduce(operator.and_, masks, ALL_ANSWERS))
 
 
 def test_count_all_affirmative_answers_from_group():
     assert count_all_affirmative_answers_from_group(["abc"]) == 3
     assert count_all_affirmative_answers_from_group(["ab", "ac"]) == 1
     assert count_all_affirmative_answers_from_group(["a", "b", "c"]) == 0
+    assert count_all_affirmative_answers_from_group([]) == 0
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-
-    print(
-        sum(
-            count_all_affirmative_answers_from_group(group_lines)
-            for group_lines in separate_group_lines(raw_lines)
-        )
-    )
+    from aoc.inputs import input_path
+
+    print(count_answers(read_group_answers(input_path(__file__)))[1])
@@ -1,9 +1,11 @@
 import re
-from pathlib import Path
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-import networkx as nx  # type: ignore
+
+# The rule of a bag, or one of the bags inside it: the tokens of the whole
+# file in order, so the contents follow the bag that holds them
+RULE_TOKENS = re.compile(rb"(?m)^(\w+ \w+) bags contain|(\d+) (\w+ \w+) bag")
 
 
 @dataclass(frozen=True)
@@ -12,6 +14,32 @@ class Rule:
     contents: Dict[str, int]
 
 
+@dataclass
+class RuleEdges:
+    # Every rule file as edges between bag ids, no Rule objects at all
+    names: List[str]
+    parents: List[int]
+    children: List[int]
+    quantities: List[int]
+
+
+def parse_rules(data: bytes) -> RuleEdges:
+    ids: Dict[bytes, int] = {}
+    parents: List[int] = []
+    children: List[int] = []
+    quantities: List[int] = []
+    parent = 0
+    for bag, quantity, child in RULE_TOKENS.findall(data):
+        if bag:
+            parent = ids.setdefault(bag, len(ids))
+        else:
+            parents.append(parent)
+            children.append(ids.setdefault(child, len(ids)))
+            quantities.append(int(quantity))
+    names = [str(name, "utf-8") for name in ids]
+    return RuleEdges(names, parents, children, quantities)
+
+
 def line_to_rule(line: str) -> Rule:
     # It can be done with only 1 regular expression? 🤔
     bag, raw_contents = line.split(" bags contain ")
@@ -22,18 +50,148 @@ def line_to_rule(line: str) -> Rule:
     return Rule(bag=bag, contents=contents)
 
 
-def rules_to_graph(rules: List[Rule]) -> nx.DiGraph:
-    graph = nx.DiGraph()
-    graph.add_nodes_from(rule.bag for rule in rules)
-    for rule in rules:
-        graph.add_edges_from(
-            (rule.bag, content_bag) for content_bag, quantity in rule.contents.items()
-        )
-    return graph
+class BagGraph:
+    # Bags are integer ids in the order they are first seen, every bag has
+    # the ids of the bags it contains and how many of each in two arrays
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.children: List[List[int]] = []
+        self.quantities: List[List[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def bag_id(self, name: str) -> int:
+        bag = self.ids.get(name)
+        if bag is None:
+            bag = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.children.append([])
+            self.quantities.append([])
+        return bag
+
+    def add_rule(self, rule: Rule) -> None:
+        bag = self.bag_id(rule.bag)
+        for content_bag, quantity in rule.contents.items():
+            self.children[bag].append(self.bag_id(content_bag))
+            self.quantities[bag].append(quantity)
+
+    @staticmethod
+    def from_edges(edges: RuleEdges) -> "BagGraph":
+        graph = BagGraph()
+        graph.names = edges.names
+        graph.ids = {name: bag for bag, name in enumerate(edges.names)}
+        graph.children = [[] for _ in edges.names]
+        graph.quantities = [[] for _ in edges.names]
+        for parent, child, quantity in zip(
+            edges.parents, edges.children, edges.quantities
+        ):
+            graph.children[parent].append(child)
+            graph.quantities[parent].append(quantity)
+        return graph
+
+    @staticmethod
+    def from_rules(rules: Iterable[Rule]) -> "BagGraph":
+        graph = BagGraph()
+        for rule in rules:
+            graph.add_rule(rule)
+        return graph
+
+    def parents(self) -> List[List[int]]:
+        parents: List[List[int]] = [[] for _ in self.names]
+        for bag, children in enumerate(self.children):
+            for child in children:
+                parents[child].append(bag)
+        return parents
+
+    def topological_order(self) -> List[int]:
+        # Every bag before the bags it contains (Kahn, no recursion)
+        pending = [0] * len(self)
+        for children in self.children:
+            for child in children:
+                pending[child] += 1
+        order = [bag for bag, count in enumerate(pending) if not count]
+        for bag in order:  # grows while it is walked
+            for child in self.children[bag]:
+                pending[child] -= 1
+                if not pending[child]:
+                    order.append(child)
+        if len(order) != len(self):
+            raise ValueError("The rules have a cycle, bags can't contain themselves")
+        return order
+
+
+class AncestorIndex:
+    # The bags that can contain every bag, worked out the first time the bag
+    # is asked for and kept. They are its parents and their ancestors, so a
+    # query only fills the bags above it that no query reached before, and
+    # asking again is a lookup. A tuple of ids per filled bag: memory grows
+    # with the answers, not with the square of the bags like bitsets would.
+    def __init__(self, graph: BagGraph) -> None:
+        self._graph = graph
+        self._parents = graph.parents()
+        self._ancestors: Dict[int, Tuple[int, ...]] = {}
 
+    def ancestors(self, bag_name: str) -> List[str]:
+        # In id order
+        bags = sorted(self._fill(self._graph.ids[bag_name]))
+        return [self._graph.names[bag] for bag in bags]
 
-def count_bags_containing_bag(graph: nx.DiGraph, bag_name: str) -> int:
-    return len(nx.algorithms.dag.ancestors(graph, bag_name))
+    def count(self, bag_name: str) -> int:
+        return len(self._fill(self._graph.ids[bag_name]))
+
+    def _fill(self, bag: int) -> Tuple[int, ...]:
+        # Post-order walk without recursion, up to the bags already filled. A
+        # bag on top again with parents still missing is inside its own bags.
+        ancestors, parents = self._ancestors, self._parents
+        pending = [bag]
+        expanded = set()
+        while pending:
+            top = pending[-1]
+            if top in ancestors:
+                pending.pop()
+                continue
+            missing = [parent for parent in parents[top] if parent not in ancestors]
+            if missing:
+                if top in expanded:
+                    raise ValueError(
+                        "The rules have a cycle, bags can't contain themselves"
+                    )
+                expanded.add(top)
+                pending.extend(missing)
+                continue
+            pending.pop()
+            ancestors[top] = tuple(
+                set(parents[top]).union(*(ancestors[parent] for parent in parents[top]))
+            )
+        return ancestors[bag]
+
+
+def rules_to_graph(rules: List[Rule]) -> BagGraph:
+    return BagGraph.from_rules(rules)
+
+
+def count_bags_containing_bag(
+    graph: BagGraph, bag_name: str, index: Optional[AncestorIndex] = None
+) -> int:
+    # Pass an AncestorIndex of the graph for many queries, it keeps what
+    # every query works out
+    if index is None:
+        return count_ancestors(graph.parents(), graph.ids[bag_name])
+    return index.count(bag_name)
+
+
+def count_ancestors(parents: List[List[int]], bag: int) -> int:
+    # A traversal per query, what the index saves
+    seen = {bag}
+    pending = [bag]
+    while pending:
+        for parent in parents[pending.pop()]:
+            if parent not in seen:
+                seen.add(parent)
+                pending.append(parent)
+    return len(seen) - 1
 
 
 def test_line_to_rule_with_no_bags():
@@ -57,6 +215,58 @@ def test_line_to_rule_with_various_bags():
     )
 
 
+def test_bag_graph():
+    graph = BagGraph.from_rules(
+        [
+            Rule(bag="c", contents={"a": 5, "b": 6}),
+            Rule(bag="a", contents={}),
+            Rule(bag="d", contents={"c": 1}),
+        ]
+    )
+    assert graph.names == ["c", "a", "b", "d"]
+    assert graph.ids == {"c": 0, "a": 1, "b": 2, "d": 3}
+    assert graph.children == [[1, 2], [], [], [0]]
+    assert graph.quantities == [[5, 6], [], [], [1]]
+    assert graph.parents() == [[3], [0], [0], []]
+    assert graph.topological_order() == [3, 0, 1, 2]
+
+
+def test_bag_graph_with_a_cycle():
+    import pytest
+
+    graph = BagGraph.from_rules(
+        [Rule(bag="a", contents={"b": 1}), Rule(bag="b", contents={"a": 1})]
+    )
+    with pytest.raises(ValueError):
+        graph.topological_order()
+
+
+def test_parse_rules():
+    edges = parse_rules(
+        b"light red bags contain 1 bright white bag, 2 muted yellow bags.\n"
+        b"faded blue bags contain no other bags.\n"
+        b"bright white bags contain 1 shiny gold bag.\n"
+    )
+    assert edges == RuleEdges(
+        names=["light red", "bright white", "muted yellow", "faded blue", "shiny gold"],
+        parents=[0, 0, 1],
+        children=[1, 2, 4],
+        quantities=[1, 2, 1],
+    )
+
+
+def test_parse_rules_agrees_with_line_to_rule():
+    from aoc.generators import generate
+
+    text = generate(7, 2000, seed=24)
+    graph = BagGraph.from_edges(parse_rules(text.encode()))
+    expected = rules_to_graph([line_to_rule(line) for line in text.splitlines()])
+    assert graph.names == expected.names
+    assert graph.ids == expected.ids
+    assert graph.children == expected.children
+    assert graph.quantities == expected.quantities
+
+
 def test_rules_to_graph():
     graph = rules_to_graph(
         [
@@ -68,8 +278,9 @@ def test_rules_to_graph():
             ),
         ]
     )
-    assert list(graph.nodes) == ["a", "b", "c"]
-    assert list(graph.edges) == [("c", "a"), ("c", "b")]
+    assert graph.names == ["a", "b", "c"]
+    assert graph.children == [[], [], [0, 1]]
+    assert graph.quantities == [[], [], [5, 6]]
 
 
 def test_count_bags_containing_bag():
@@ -93,10 +304,55 @@ def test_count_bags_containing_bag():
     )
     assert count_bags_containing_bag(graph, "a") == 3
     assert count_bags_containing_bag(graph, "c") == 1
+    index = AncestorIndex(graph)
+    assert count_bags_containing_bag(graph, "a", index) == 3
+    assert count_bags_containing_bag(graph, "e", index) == 0
+
+
+def test_ancestor_index():
+    graph = rules_to_graph(
+        [
+            Rule(bag="e", contents={"c": 1, "d": 2}),
+            Rule(bag="c", contents={"a": 5, "b": 6}),
+            Rule(bag="d", contents={"a": 3}),
+        ]
+    )
+    index = AncestorIndex(graph)
+    assert index.ancestors("a") == ["e", "c", "d"]
+    assert [index.count(bag) for bag in "abcde"] == [3, 2, 1, 1, 0]
+    assert index.count("a") == 3
+
+
+def test_ancestor_index_with_a_cycle():
+    import pytest
+
+    graph = rules_to_graph(
+        [
+            Rule(bag="a", contents={"b": 1}),
+            Rule(bag="b", contents={"c": 1}),
+            Rule(bag="c", contents={"a": 1}),
+            Rule(bag="d", contents={"a": 1}),
+        ]
+    )
+    with pytest.raises(ValueError):
+        AncestorIndex(graph).count("a")
+
+
+def test_ancestor_index_agrees_with_traversals():
+    from aoc.generators import generate
+
+    graph = rules_to_graph(
+        [line_to_rule(line) for line in generate(7, 2000, seed=22).splitlines()]
+    )
+    index = AncestorIndex(graph)
+    parents = graph.parents()
+    assert [index.count(name) for name in graph.names] == [
+        count_ancestors(parents, bag) for bag in range(len(graph))
+    ]
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        rules = [line_to_rule(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path
 
-    print(count_bags_containing_bag(rules_to_graph(rules), "shiny gold"))
+    graph = BagGraph.from_edges(parse_rules(input_path(__file__).read_bytes()))
+    print(count_bags_containing_bag(graph, "shiny gold"))
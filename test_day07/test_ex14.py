@@ -1,88 +1,151 @@
-import re
-from pathlib import Path
-from typing import List, Dict
-from dataclasses import dataclass
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+)
 
-import networkx as nx  # type: ignore
+from test_day07.test_ex13 import (
+    BagGraph,
+    Rule,
+    line_to_rule,
+    parse_rules,
+    rules_to_graph,
+)
 
+T = TypeVar("T")
 
-@dataclass(frozen=True)
-class Rule:
-    bag: str
-    contents: Dict[str, int]
 
+def contained_totals(graph: BagGraph) -> List[int]:
+    # Bags inside every bag, by id. The bags they contain are always done
+    # first, so every bag is a single sum over its children.
+    totals = [0] * len(graph)
+    for bag in reversed(graph.topological_order()):
+        totals[bag] = sum(
+            quantity * (1 + totals[child])
+            for child, quantity in zip(graph.children[bag], graph.quantities[bag])
+        )
+    return totals
 
-def line_to_rule(line: str) -> Rule:
-    # It can be done with only 1 regular expression? 🤔
-    bag, raw_contents = line.split(" bags contain ")
-    contents: Dict[str, int] = {
-        match_object[2]: int(match_object[1])
-        for match_object in re.findall(r"((\d) (\w+ \w+) bags?[,\.])", raw_contents)
-    }
-    return Rule(bag=bag, contents=contents)
 
+def count_total_contained_bags(
+    graph: BagGraph, bag_name: str, totals: Optional[List[int]] = None
+) -> int:
+    # Pass the contained_totals of the graph to answer many bags with one pass
+    if totals is None:
+        totals = contained_totals(graph)
+    return totals[graph.ids[bag_name]]
 
-def rules_to_graph(rules: List[Rule]) -> nx.DiGraph:
-    graph = nx.DiGraph()
-    graph.add_nodes_from(rule.bag for rule in rules)
-    for rule in rules:
-        graph.add_weighted_edges_from(
-            (rule.bag, content_bag, quantity)
-            for content_bag, quantity in rule.contents.items()
-        )
-    return graph
 
+class RuleSet:
+    # Rules that can be inserted, updated and deleted, with the contained
+    # totals and the ancestors of the bags cached as they are asked for.
+    # A bag's total only depends on the bags inside it, so a cached total
+    # means all of those are cached too, and an edit only drops the totals
+    # of the edited bag and the bags above it. The ancestors work the other
+    # way round: only the bags below a changed edge are dropped.
+    def __init__(self, rules: Iterable[Rule] = ()) -> None:
+        self._contents: Dict[str, Dict[str, int]] = {}
+        self._parents: Dict[str, Set[str]] = defaultdict(set)
+        self._totals: Dict[str, int] = {}
+        self._ancestors: Dict[str, FrozenSet[str]] = {}
+        self.computed_totals = 0  # how many bag totals were worked out so far
+        for rule in rules:
+            self.set_rule(rule)
 
-def count_total_contained_bags(graph: nx.DiGraph, bag_name: str) -> int:
-    def _count_total_contained_bags(actual_bag: str) -> int:
-        if not graph.out_degree[actual_bag]:
-            return 1
+    def __contains__(self, bag_name: str) -> bool:
+        return bag_name in self._contents
 
-        return 1 + sum(
-            _count_total_contained_bags(child) * data["weight"]
-            for child, data in graph[actual_bag].items()
-        )
+    def __len__(self) -> int:
+        return len(self._contents)
 
-    return _count_total_contained_bags(bag_name) - 1
+    def set_rule(self, rule: Rule) -> None:
+        # Inserts the rule, or updates it when the bag already has one
+        self._replace(rule.bag, dict(rule.contents))
 
+    def delete_rule(self, bag_name: str) -> None:
+        if bag_name not in self._contents:
+            raise KeyError(bag_name)
+        self._replace(bag_name, {})
+        del self._contents[bag_name]
 
-def test_line_to_rule_with_no_bags():
-    assert line_to_rule("faded blue bags contain no other bags.") == Rule(
-        bag="faded blue", contents={}
-    )
+    def _replace(self, bag_name: str, contents: Dict[str, int]) -> None:
+        old = self._contents.get(bag_name, {})
+        for child in old.keys() - contents.keys():
+            self._parents[child].discard(bag_name)
+        for child in contents.keys() - old.keys():
+            self._parents[child].add(bag_name)
+        self._contents[bag_name] = contents
+        _forget(bag_name, self._totals, self._parents)
+        for child in old.keys() ^ contents.keys():
+            _forget(child, self._ancestors, self._contents)
 
+    def total(self, bag_name: str) -> int:
+        def total(bag: str) -> int:
+            self.computed_totals += 1
+            return sum(
+                quantity * (1 + self._totals[child])
+                for child, quantity in self._contents.get(bag, {}).items()
+            )
 
-def test_line_to_rule_with_one_bag():
-    assert line_to_rule("bright white bags contain 1 shiny gold bag.") == Rule(
-        bag="bright white", contents={"shiny gold": 1}
-    )
+        return _fill(bag_name, self._totals, self._contents, total)
 
+    def ancestors(self, bag_name: str) -> FrozenSet[str]:
+        def ancestors(bag: str) -> FrozenSet[str]:
+            parents = self._parents.get(bag, set())
+            return frozenset(parents).union(
+                *(self._ancestors[parent] for parent in parents)
+            )
 
-def test_line_to_rule_with_various_bags():
-    assert line_to_rule(
-        "shiny gold bags contain 2 dark olive bag, 2 vibrant plum bags, 3 bright white bags."
-    ) == Rule(
-        bag="shiny gold",
-        contents={"dark olive": 2, "vibrant plum": 2, "bright white": 3},
-    )
+        return _fill(bag_name, self._ancestors, self._parents, ancestors)
 
 
-def test_rules_to_graph():
-    graph = rules_to_graph(
-        [
-            Rule(bag="a", contents={}),
-            Rule(bag="b", contents={}),
-            Rule(
-                bag="c",
-                contents={"a": 5, "b": 6},
-            ),
-        ]
-    )
-    assert list(graph.nodes) == ["a", "b", "c"]
-    assert list(graph.edges.data()) == [
-        ("c", "a", {"weight": 5}),
-        ("c", "b", {"weight": 6}),
-    ]
+def _forget(
+    bag_name: str, cache: Dict[str, Any], edges: Mapping[str, Iterable[str]]
+) -> None:
+    # Drops the cached bag and, following the edges, every cached bag that
+    # depends on it. An uncached bag has no cached dependents.
+    pending = [bag_name]
+    while pending:
+        bag = pending.pop()
+        if cache.pop(bag, None) is not None:
+            pending.extend(edges.get(bag, ()))
+
+
+def _fill(
+    bag_name: str,
+    cache: Dict[str, T],
+    edges: Mapping[str, Iterable[str]],
+    compute: Callable[[str], T],
+) -> T:
+    # Post-order walk without recursion, down to the bags already cached. A
+    # bag on top again with bags still missing is inside its own bags.
+    pending = [bag_name]
+    expanded = set()
+    while pending:
+        bag = pending[-1]
+        if bag in cache:
+            pending.pop()
+            continue
+        missing = [other for other in edges.get(bag, ()) if other not in cache]
+        if missing:
+            if bag in expanded:
+                raise ValueError(
+                    "The rules have a cycle, bags can't contain themselves"
+                )
+            expanded.add(bag)
+            pending.extend(missing)
+            continue
+        pending.pop()
+        cache[bag] = compute(bag)
+    return cache[bag_name]
 
 
 def test_count_total_contained_bags():
@@ -98,10 +161,111 @@ def test_count_total_contained_bags():
         ]
     )
     assert count_total_contained_bags(graph, "a") == 126
+    totals = contained_totals(graph)
+    assert totals == [126, 62, 30, 14, 6, 2, 0]
+    assert count_total_contained_bags(graph, "c", totals) == 30
+
+
+def test_count_total_contained_bags_in_a_deep_chain():
+    # Far beyond the recursion limit
+    rules = [Rule(bag=str(i), contents={str(i + 1): 1}) for i in range(100000)]
+    assert count_total_contained_bags(rules_to_graph(rules), "0") == 100000
+
+
+def test_count_total_contained_bags_in_diamonds():
+    # Two bags per level, both containing both bags of the next one: 2^100
+    # paths, every shared bag is still counted once
+    rules = [
+        Rule(bag=f"{side} {level}", contents={f"a {level + 1}": 1, f"b {level + 1}": 1})
+        for level in range(100)
+        for side in "ab"
+    ]
+    assert count_total_contained_bags(rules_to_graph(rules), "a 0") == 2 ** 101 - 2
+
+
+def test_rule_set():
+    import pytest
+
+    rules = RuleSet(
+        [
+            Rule(bag="a", contents={"b": 2}),
+            Rule(bag="b", contents={"c": 3}),
+            Rule(bag="c", contents={}),
+            Rule(bag="d", contents={"c": 1}),
+        ]
+    )
+    assert (len(rules), "b" in rules, "z" in rules) == (4, True, False)
+    assert rules.total("a") == 8
+    assert rules.ancestors("c") == {"a", "b", "d"}
+    rules.set_rule(Rule(bag="c", contents={"e": 1}))
+    assert rules.total("a") == 14
+    assert rules.total("d") == 2
+    rules.set_rule(Rule(bag="b", contents={"e": 2}))
+    assert rules.total("a") == 6
+    assert rules.ancestors("c") == {"d"}
+    assert rules.ancestors("e") == {"a", "b", "c", "d"}
+    rules.delete_rule("d")
+    assert rules.ancestors("c") == set()
+    assert rules.ancestors("e") == {"a", "b", "c"}
+    rules.set_rule(Rule(bag="e", contents={"a": 1}))
+    with pytest.raises(ValueError):
+        rules.total("a")
+    with pytest.raises(ValueError):
+        rules.ancestors("a")
+    with pytest.raises(KeyError):
+        rules.delete_rule("z")
+
+
+def test_rule_set_keeps_the_unaffected_totals():
+    rules = RuleSet(
+        [
+            Rule(bag="a", contents={"b": 1, "c": 1}),
+            Rule(bag="b", contents={"d": 1}),
+            Rule(bag="c", contents={}),
+        ]
+    )
+    assert rules.total("a") == 3
+    assert rules.computed_totals == 4
+    rules.set_rule(Rule(bag="d", contents={"e": 4}))
+    assert rules.total("a") == 7
+    assert rules.computed_totals == 8  # e, d, b and a again, c is kept
+    assert rules.total("b") == 5
+    assert rules.computed_totals == 8
+
+
+def test_rule_set_agrees_with_a_rebuild():
+    import random
+
+    from aoc.generators import generate
+    from test_day07.test_ex13 import AncestorIndex
+
+    rules = [line_to_rule(line) for line in generate(7, 300, seed=23).splitlines()]
+    rule_set = RuleSet(rules)
+    rng = random.Random(23)
+    for _ in range(30):
+        # Only rules for bags deeper than any of their new contents, no cycles
+        rule = rng.choice(rules)
+        graph = rules_to_graph(rules)
+        below = [graph.names[bag] for bag in graph.topological_order()]
+        below = below[below.index(rule.bag) + 1 :]
+        edited = Rule(
+            bag=rule.bag,
+            contents={
+                bag: rng.randint(1, 3) for bag in rng.sample(below, min(2, len(below)))
+            },
+        )
+        rules[rules.index(rule)] = edited
+        rule_set.set_rule(edited)
+        graph = rules_to_graph(rules)
+        index = AncestorIndex(graph)
+        totals = contained_totals(graph)
+        for name in rng.sample(graph.names, 10):
+            assert rule_set.total(name) == totals[graph.ids[name]]
+            assert rule_set.ancestors(name) == set(index.ancestors(name))
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        rules = [line_to_rule(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path
 
-    print(count_total_contained_bags(rules_to_graph(rules), "shiny gold"))
+    graph = BagGraph.from_edges(parse_rules(input_path(__file__).read_bytes()))
+    print(count_total_contained_bags(graph, "shiny gold"))
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List
 from dataclasses import dataclass
 
@@ -59,8 +58,11 @@ def test_execute_program():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        instructions = [line_to_instruction(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_lines
+
+    instructions = [
+        line_to_instruction(line) for line in read_lines(input_path(__file__))
+    ]
 
     program = Program(instructions)
     program.execute()
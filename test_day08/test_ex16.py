@@ -1,9 +1,6 @@
-from pathlib import Path
-from typing import List, Set, Generator
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-import pytest
-
 
 @dataclass(frozen=True)
 class Instruction:
@@ -11,6 +8,11 @@ class Instruction:
     argument: int
 
 
+ACC, JMP, NOP = range(3)
+
+OPCODES = {"acc": ACC, "jmp": JMP, "nop": NOP}
+
+
 class InfiniteLoopError(Exception):
     pass
 
@@ -18,30 +20,106 @@ class InfiniteLoopError(Exception):
 class Program:
     def __init__(self, instructions: List[Instruction]) -> None:
         self._reset()
-        self._instructions = instructions
+        # Compiled once into parallel arrays, the run loops only compare ints
+        self._opcodes = bytearray(
+            OPCODES[instruction.operation] for instruction in instructions
+        )
+        self._arguments = [instruction.argument for instruction in instructions]
+        self._blocks: Optional[Tuple[List[int], List[int], Dict[int, int]]] = None
 
     def _reset(self) -> None:
         self._index: int = 0
         self._accumulator: int = 0
-        self._visited_index: Set[int] = set()
 
     @property
     def accumulator(self) -> int:
         return self._accumulator
 
-    def execute(self) -> None:
+    def execute(self, blocks: bool = False) -> None:
+        # blocks runs a whole block per step, worth it when the same program
+        # is run many times (the blocks are compiled on the first run)
         self._reset()
-        while self._index < len(self._instructions):
-            self._check_visited_index(self._index)
-            instruction = self._instructions[self._index]
-            if instruction.operation == "acc":
-                self._accumulator += instruction.argument
-            self._index += instruction.argument if instruction.operation == "jmp" else 1
-
-    def _check_visited_index(self, index: int) -> None:
-        if index in self._visited_index:
-            raise InfiniteLoopError(f"Index {index} visited twice.")
-        self._visited_index.add(index)
+        if blocks:
+            self._execute_blocks()
+        else:
+            self._execute_instructions()
+
+    def swap(self, index: int) -> None:
+        # jmp <-> nop in place, the blocks stay valid
+        if self._opcodes[index] == ACC:
+            raise ValueError(f"Index {index} is an acc, it can't be swapped.")
+        self._opcodes[index] = NOP if self._opcodes[index] == JMP else JMP
+        if self._blocks is not None:
+            _, exits, block_of = self._blocks
+            exits[block_of[index]] = self._exit(index)
+
+    def _exit(self, index: int) -> int:
+        if self._opcodes[index] == JMP:
+            return index + self._arguments[index]
+        return index + 1
+
+    def _execute_instructions(self) -> None:
+        opcodes, arguments = self._opcodes, self._arguments
+        visited = bytearray(len(opcodes))
+        index = accumulator = 0
+        try:
+            while index < len(opcodes):
+                if visited[index]:
+                    raise InfiniteLoopError(f"Index {index} visited twice.")
+                visited[index] = 1
+                opcode = opcodes[index]
+                if opcode == JMP:
+                    index += arguments[index]
+                    continue
+                if opcode == ACC:
+                    accumulator += arguments[index]
+                index += 1
+        finally:
+            self._index, self._accumulator = index, accumulator
+
+    def _compile_blocks(self) -> Tuple[List[int], List[int], Dict[int, int]]:
+        # A block is a run of acc ending in a jmp or nop, entered only at its
+        # start: blocks start at 0, after every jmp or nop and where any of
+        # them could jump (nop included, so swapping never splits a block).
+        # The first instruction run twice is always the start of a block, so
+        # checking the starts only stops at the very same point.
+        count = len(self._opcodes)
+        starts = bytearray(count + 1)
+        starts[0] = 1
+        for index, opcode in enumerate(self._opcodes):
+            if opcode != ACC:
+                starts[index + 1] = 1
+                if 0 <= index + self._arguments[index] < count:
+                    starts[index + self._arguments[index]] = 1
+        deltas, exits = [0] * count, [0] * count
+        block_of: Dict[int, int] = {}  # jmp or nop -> start of its block
+        start = 0
+        for index, opcode in enumerate(self._opcodes):
+            if starts[index]:
+                start = index
+            if opcode == ACC:
+                deltas[start] += self._arguments[index]
+                exits[start] = index + 1
+            else:
+                exits[start] = self._exit(index)
+                block_of[index] = start
+        return deltas, exits, block_of
+
+    def _execute_blocks(self) -> None:
+        if self._blocks is None:
+            self._blocks = self._compile_blocks()
+        deltas, exits, _ = self._blocks
+        visited = bytearray(len(deltas))
+        index = accumulator = 0
+        try:
+            while index < len(deltas):
+                if visited[index]:
+                    raise InfiniteLoopError(f"Index {index} visited twice.")
+                visited[index] = 1
+                accumulator += deltas[index]
+                index = exits[index]
+        finally:
+            self._index, self._accumulator = index, accumulator
 
 
 def line_to_instruction(line: str) -> Instruction:
@@ -50,27 +128,23 @@ def line_to_instruction(line: str) -> Instruction:
 
 
 def sanitize_instructions(instructions: List[Instruction]) -> List[Instruction]:
-    for alternative_instructions in _generate_alternative_instructions(instructions):
-        program = Program(alternative_instructions)
+    # One program, every jmp or nop swapped in place and back
+    program = Program(instructions)
+    for i, instruction in enumerate(instructions):
+        if instruction.operation not in ["jmp", "nop"]:
+            continue
+        program.swap(i)
         try:
-            program.execute()
-            return alternative_instructions
+            program.execute(blocks=True)
         except InfiniteLoopError:
+            program.swap(i)
             continue
+        healthy_instructions = instructions.copy()
+        healthy_instructions[i] = _swap_nop_jmp_instruction(instruction)
+        return healthy_instructions
     raise Exception("Not found D:")
 
 
-def _generate_alternative_instructions(
-    instructions: List[Instruction],
-) -> Generator[List[Instruction], None, None]:
-    alternative_instructions = instructions.copy()
-    for i, instruction in enumerate(instructions):
-        if instruction.operation in ["jmp", "nop"]:
-            alternative_instructions[i] = _swap_nop_jmp_instruction(instruction)
-            yield alternative_instructions
-            alternative_instructions[i] = instruction
-
-
 def _swap_nop_jmp_instruction(instruction: Instruction) -> Instruction:
     if instruction.operation == "jmp":
         return Instruction("nop", instruction.argument)
@@ -97,6 +171,8 @@ test_instructions = [
 
 
 def test_execute_program():
+    import pytest
+
     program = Program(test_instructions)
     with pytest.raises(InfiniteLoopError):
         program.execute()
@@ -111,6 +187,48 @@ def test_execute_healthy_program():
     assert program.accumulator == 42
 
 
+def test_execute_blocks():
+    import pytest
+
+    program = Program(test_instructions)
+    with pytest.raises(InfiniteLoopError, match="Index 1 visited twice."):
+        program.execute(blocks=True)
+    assert program.accumulator == 5
+    program.swap(7)
+    program.execute(blocks=True)
+    assert program.accumulator == 8
+    program.execute()
+    assert program.accumulator == 8
+    with pytest.raises(ValueError):
+        program.swap(1)
+
+
+def test_execute_blocks_agrees_with_instructions():
+    import random
+
+    from aoc.generators import generate
+
+    lines = generate(8, 500, seed=25).splitlines()
+    instructions = [line_to_instruction(line) for line in lines]
+    program = Program(instructions)
+    swappable = [
+        i
+        for i, instruction in enumerate(instructions)
+        if instruction.operation != "acc"
+    ]
+    for i in random.Random(25).sample(swappable, 50):
+        program.swap(i)
+        results = []
+        for blocks in (False, True):
+            try:
+                program.execute(blocks)
+                results.append(("end", program.accumulator))
+            except InfiniteLoopError as error:
+                results.append((str(error), program.accumulator))
+        assert results[0] == results[1]
+        program.swap(i)
+
+
 def test_sanitize_instructions():
     healthy_instructions = sanitize_instructions(test_instructions)
     program = Program(healthy_instructions)
@@ -119,10 +237,13 @@ def test_sanitize_instructions():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        instructions = [line_to_instruction(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_lines
+
+    instructions = [
+        line_to_instruction(line) for line in read_lines(input_path(__file__))
+    ]
 
     healthy_instructions = sanitize_instructions(instructions)
     program = Program(healthy_instructions)
-    program.execute()
+    program.execute()  # a single run, compiling the blocks wouldn't pay off
     print(program.accumulator)
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List
 from itertools import dropwhile, combinations
 
@@ -45,7 +44,8 @@ def test_find_invalid_number():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        numbers = [int(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_ints
+
+    numbers = list(read_ints(input_path(__file__)))
 
     print(find_invalid_number(numbers))
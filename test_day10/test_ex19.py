@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List, Iterable, Any
 from itertools import tee
 
@@ -31,7 +30,8 @@ def test_find_jolt_differences_calculation():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        numbers = [int(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_ints
+
+    numbers = list(read_ints(input_path(__file__)))
 
     print(find_jolt_differences_calculation(numbers))
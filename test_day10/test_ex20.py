@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List
 from collections import defaultdict
 
@@ -25,7 +24,8 @@ def test_count_all_possible_paths():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        numbers = [int(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_ints
+
+    numbers = list(read_ints(input_path(__file__)))
 
     print(count_all_possible_paths(numbers))
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List, Any, Generator, Tuple
 
 
@@ -178,7 +177,8 @@ def test_final_occupied_count():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        rows = [line.rstrip("\n") for line in f]
+    from aoc.inputs import input_path, read_lines
+
+    rows = list(read_lines(input_path(__file__)))
 
     print(SeatLayout(rows).iterate_until_no_changes().count_occupied_seats())
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List, Tuple, Any, Mapping, Type
 from abc import ABC, abstractmethod
 
@@ -164,7 +163,8 @@ def test_line_to_action():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        actions = [line_to_action(line.rstrip("\n")) for line in f]
+    from aoc.inputs import input_path, read_lines
+
+    actions = [line_to_action(line) for line in read_lines(input_path(__file__))]
 
     print(process_actions(actions))
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List
 import math
 
@@ -16,8 +15,10 @@ def test_find_id_x_waiting():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        min_time = int(next(f).rstrip("\n"))
-        shuttles = [int(shuttle) for shuttle in next(f).split(",") if shuttle != "x"]
+    from aoc.inputs import input_path, read_lines
+
+    min_time_line, shuttles_line = read_lines(input_path(__file__))
+    min_time = int(min_time_line)
+    shuttles = [int(shuttle) for shuttle in shuttles_line.split(",") if shuttle != "x"]
 
     print(find_id_x_waiting(min_time, shuttles))
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import Dict
 import functools
 import operator
@@ -24,12 +23,13 @@ def test_find_eatliest_timestamp():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        _ = next(f)
-        shuttles = {
-            i: int(shuttle)
-            for i, shuttle in enumerate(next(f).split(","))
-            if shuttle != "x"
-        }
+    from aoc.inputs import input_path, read_lines
+
+    _, shuttles_line = read_lines(input_path(__file__))
+    shuttles = {
+        i: int(shuttle)
+        for i, shuttle in enumerate(shuttles_line.split(","))
+        if shuttle != "x"
+    }
 
     print(find_eatliest_timestamp(shuttles))
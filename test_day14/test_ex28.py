@@ -1,10 +1,7 @@
 import re
-from pathlib import Path
 from typing import List, Tuple, Union
 from collections import UserDict
 
-import pytest
-
 
 class DockingMemory(UserDict):
     _MASK_LEN = 36
@@ -65,6 +62,8 @@ def test_set_mask():
 
 
 def test_set_item():
+    import pytest
+
     memory = DockingMemory()
     memory.set_mask("000000000000000000000000000000X1001X")
     memory[42] = 100
@@ -88,14 +87,14 @@ def test_get_mask_from_line():
 
 
 if __name__ == "__main__":
+    from aoc.inputs import input_path, read_lines
+
     memory = DockingMemory()
-    with open((Path(__file__).parent / "input.txt")) as f:
-        for line in f:
-            clean_line = line.rstrip("\n")
-            if clean_line.startswith("mask"):
-                memory.set_mask(get_mask_from_line(clean_line))
-            else:
-                key, value = get_key_value_from_line(clean_line)
-                memory[key] = value
+    for clean_line in read_lines(input_path(__file__)):
+        if clean_line.startswith("mask"):
+            memory.set_mask(get_mask_from_line(clean_line))
+        else:
+            key, value = get_key_value_from_line(clean_line)
+            memory[key] = value
 
     print(sum(value for value in memory.values()))
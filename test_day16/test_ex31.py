@@ -1,6 +1,5 @@
 import re
 import itertools
-from pathlib import Path
 from typing import List, Set
 
 
@@ -71,17 +70,17 @@ def test_find_invalid_ticket_fields():
 
 
 if __name__ == "__main__":
+    from aoc.inputs import input_path, read_lines
+
     validations = []
     tickets = []
-    with open((Path(__file__).parent / "input.txt")) as f:
-        for line in f:
-            clean_line = line.rstrip("\n")
-            if clean_line in ["", "your ticket:", "nearby tickets:"]:
-                continue
-            if clean_line[0].isnumeric():
-                tickets.append([int(field) for field in clean_line.split(",")])
-            else:
-                validations.append(TicketValidation.build_from_line(clean_line))
+    for clean_line in read_lines(input_path(__file__)):
+        if clean_line in ["", "your ticket:", "nearby tickets:"]:
+            continue
+        if clean_line[0].isnumeric():
+            tickets.append([int(field) for field in clean_line.split(",")])
+        else:
+            validations.append(TicketValidation.build_from_line(clean_line))
     tickets = tickets[1:]  # remove "your ticket"
 
     print(
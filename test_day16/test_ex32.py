@@ -1,7 +1,6 @@
 import re
 import functools
 import operator
-from pathlib import Path
 from typing import List, Set, Dict
 from collections import defaultdict
 
@@ -121,17 +120,17 @@ def test_guess_field_order():
 
 
 if __name__ == "__main__":
+    from aoc.inputs import input_path, read_lines
+
     validations = []
     tickets = []
-    with open((Path(__file__).parent / "input.txt")) as f:
-        for line in f:
-            clean_line = line.rstrip("\n")
-            if clean_line in ["", "your ticket:", "nearby tickets:"]:
-                continue
-            if clean_line[0].isnumeric():
-                tickets.append([int(field) for field in clean_line.split(",")])
-            else:
-                validations.append(TicketValidation.build_from_line(clean_line))
+    for clean_line in read_lines(input_path(__file__)):
+        if clean_line in ["", "your ticket:", "nearby tickets:"]:
+            continue
+        if clean_line[0].isnumeric():
+            tickets.append([int(field) for field in clean_line.split(",")])
+        else:
+            validations.append(TicketValidation.build_from_line(clean_line))
     my_ticket, tickets = tickets[0], tickets[1:]
     valid_tickets = [
         ticket
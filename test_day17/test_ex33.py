@@ -1,9 +1,8 @@
-from pathlib import Path
 from typing import List, Set
 from dataclasses import dataclass
 from collections import UserDict
 
-import pytest
+from aoc.testing import slow
 
 
 @dataclass(frozen=True)
@@ -133,7 +132,7 @@ def test_fast_pocket_dimension_count_active() -> None:
     assert dimension.count_active_cubes() == 21
 
 
-@pytest.mark.skip("Slow test, run it manually 🙏")
+@slow
 def test_pocket_dimension_count_active() -> None:
     dimension = build_pocket_dimension_from_lines([".#.", "..#", "###"])
     dimension = dimension.next_cycle()
@@ -146,8 +145,9 @@ def test_pocket_dimension_count_active() -> None:
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
+    from aoc.inputs import input_path, read_lines
+
+    lines = list(read_lines(input_path(__file__)))
 
     dimension = build_pocket_dimension_from_lines(lines)
     dimension = dimension.next_cycle()
@@ -1,9 +1,8 @@
-from pathlib import Path
 from typing import List, Set
 from dataclasses import dataclass
 from collections import UserDict
 
-import pytest
+from aoc.testing import slow
 
 
 @dataclass(frozen=True)
@@ -61,6 +60,13 @@ def build_pocket_dimension_from_lines(lines: List[str]) -> PocketDimension:
     return dimension
 
 
+def boot(lines: List[str], cycles: int = 6) -> int:
+    dimension = build_pocket_dimension_from_lines(lines)
+    for _ in range(cycles):
+        dimension = dimension.next_cycle()
+    return dimension.count_active_cubes()
+
+
 def test_empty_pocket_dimension() -> None:
     dimension = PocketDimension()
     assert dimension[Coordinates(0, 0, 0, 0)] is False
@@ -99,7 +105,11 @@ def test_fast_pocket_dimension_count_active() -> None:
     assert dimension.count_active_cubes() == 29
 
 
-@pytest.mark.skip("Slow test, run it manually 🙏")
+def test_boot_one_cycle() -> None:
+    assert boot([".#.", "..#", "###"], cycles=1) == 29
+
+
+@slow
 def test_pocket_dimension_count_active() -> None:
     dimension = build_pocket_dimension_from_lines([".#.", "..#", "###"])
     dimension = dimension.next_cycle()
@@ -112,15 +122,10 @@ def test_pocket_dimension_count_active() -> None:
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
+    from aoc.cache import cached
+    from aoc.inputs import input_path, read_lines
 
-    # Slow, it lasts ~1m20s
-    dimension = build_pocket_dimension_from_lines(lines)
-    dimension = dimension.next_cycle()
-    dimension = dimension.next_cycle()
-    dimension = dimension.next_cycle()
-    dimension = dimension.next_cycle()
-    dimension = dimension.next_cycle()
-    dimension = dimension.next_cycle()
-    print(dimension.count_active_cubes())
+    lines = list(read_lines(input_path(__file__)))
+
+    # Slow, it lasts ~1m20s (only the first time with AOC_CACHE=1)
+    print(cached(boot)(lines))
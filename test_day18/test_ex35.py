@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import Tuple
 import operator
 
@@ -45,7 +44,6 @@ def test_solve_operation_with_parentheses() -> None:
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
+    from aoc.inputs import input_path, read_lines
 
-    print(sum(solve_operation(line) for line in lines))
+    print(sum(solve_operation(line) for line in read_lines(input_path(__file__))))
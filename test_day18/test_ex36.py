@@ -1,6 +1,3 @@
-from pathlib import Path
-
-
 def solve_operation(operation: str) -> int:
     from_index = 0
     while (add_index := operation.find("+", from_index)) != -1:
@@ -45,7 +42,6 @@ def test_solve_operation_with_parentheses() -> None:
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
+    from aoc.inputs import input_path, read_lines
 
-    print(sum(solve_operation(line) for line in lines))
+    print(sum(solve_operation(line) for line in read_lines(input_path(__file__))))
@@ -1,4 +1,3 @@
-import regex  # type: ignore
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -68,6 +67,8 @@ def test_build_rules_from_lines():
 
 
 def test_recursive_rules():
+    import regex  # type: ignore
+
     rules_regex, message_lines = parse_input("input_test.txt")
     assert (
         sum(bool(regex.fullmatch(rules_regex, message)) for message in message_lines)
@@ -76,5 +77,7 @@ def test_recursive_rules():
 
 
 if __name__ == "__main__":
+    import regex
+
     rules_regex, message_lines = parse_input("input.txt")
     print(sum(bool(regex.fullmatch(rules_regex, message)) for message in message_lines))
@@ -1,9 +1,11 @@
 from pathlib import Path
-from typing import Set, List, Generator, Any
-from itertools import takewhile, combinations
+from typing import Set, List, Any
+from itertools import combinations
 import functools
 import operator
 
+from aoc.inputs import input_path, read_records
+
 
 class Tile:
     def __init__(self, tile_id: int, tile_data: List[str]) -> None:
@@ -67,12 +69,6 @@ def find_tileset_corner_multiplication(tileset: List[Tile]) -> int:
     return functools.reduce(operator.mul, (corner.id for corner in corners), 1)
 
 
-def generate_chunks_of_lines(raw_lines: List[str]) -> Generator[List[str], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while (lines := list(takewhile(lambda line: line != "", raw_lines_iterator))) :
-        yield lines
-
-
 def test_build_tile_from_chunk_of_lines() -> None:
     tile = Tile.from_chunk_of_lines(
         [
@@ -103,28 +99,16 @@ def test_build_tile_from_chunk_of_lines() -> None:
 
 
 def test_find_tileset_corner_multiplication() -> None:
-    with open((Path(__file__).parent / "input_test.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-
     tiles = [
         Tile.from_chunk_of_lines(chunk_of_lines)
-        for chunk_of_lines in generate_chunks_of_lines(raw_lines)
+        for chunk_of_lines in read_records(Path(__file__).parent / "input_test.txt")
     ]
     assert find_tileset_corner_multiplication(tiles) == 20899048083289
 
 
-def test_generate_chunks_of_lines() -> None:
-    assert list(
-        generate_chunks_of_lines(["a", "b", "", "c", "d", "", "e", "f", "g"])
-    ) == [["a", "b"], ["c", "d"], ["e", "f", "g"]]
-
-
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-
     tiles = [
         Tile.from_chunk_of_lines(chunk_of_lines)
-        for chunk_of_lines in generate_chunks_of_lines(raw_lines)
+        for chunk_of_lines in read_records(input_path(__file__))
     ]
     print(find_tileset_corner_multiplication(tiles))
@@ -1,6 +1,4 @@
-from pathlib import Path
-from typing import Set, List, Generator, Any
-from itertools import takewhile
+from typing import Set, List, Any
 
 
 class Tile:
@@ -79,12 +77,6 @@ class Image:
         self._data: List[str] = []
 
 
-def generate_chunks_of_lines(raw_lines: List[str]) -> Generator[List[str], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while (lines := list(takewhile(lambda line: line != "", raw_lines_iterator))) :
-        yield lines
-
-
 def test_build_tile_from_chunk_of_lines() -> None:
     tile = Tile.from_chunk_of_lines(
         [
@@ -114,18 +106,11 @@ def test_build_tile_from_chunk_of_lines() -> None:
     }
 
 
-def test_generate_chunks_of_lines() -> None:
-    assert list(
-        generate_chunks_of_lines(["a", "b", "", "c", "d", "", "e", "f", "g"])
-    ) == [["a", "b"], ["c", "d"], ["e", "f", "g"]]
-
-
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
+    from aoc.inputs import input_path, read_records
 
     tiles = [
         Tile.from_chunk_of_lines(chunk_of_lines)
-        for chunk_of_lines in generate_chunks_of_lines(raw_lines)
+        for chunk_of_lines in read_records(input_path(__file__))
     ]
     # TO BE CONTINUED